@@ -19,6 +19,7 @@ from .k_pairings import (
     detect_naming_pairings,
     extract_cell_patterns,
     extract_pairings_from_rules,
+    index_pairings,
 )
 from .k_semantics import KSemanticsExtractor, ParsedRule
 from .linker import AxiomLinker
@@ -47,6 +48,7 @@ __all__ = [
     "generate_extraction_prompt",
     "HIGH_SIGNAL_LIBRARY_SECTIONS",
     "HIGH_SIGNAL_SECTIONS",
+    "index_pairings",
     "KDependencyExtractor",
     "KSemanticsExtractor",
     "ParsedRule",
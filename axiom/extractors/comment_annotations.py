@@ -17,14 +17,42 @@ function pairings and usage idioms:
     // @axiom:template resource_acquire(${r}) { ${body} } resource_release(${r})
 """
 
+import concurrent.futures
+import hashlib
+import mmap
+import os
 import re
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
 from pathlib import Path
 
 from axiom.models.pairing import Idiom, Pairing
 
+# Marker every annotation contains, for cheap pre-filtering of files
+ANNOTATION_TAG = "@axiom:"
+ANNOTATION_MARKER = ANNOTATION_TAG.encode()
+
+# Files at least this large are pre-filtered with an mmap byte search before
+# being decoded; smaller files are read once and searched as text
+MMAP_PREFILTER_MIN_SIZE = 1 << 20
+
 # Regex patterns for @axiom: annotations
 AXIOM_TAG_PATTERN = re.compile(r"@axiom:(\w+)\s+(.+?)(?=\s*(?:\*/|$))", re.MULTILINE)
 
+# Consecutive // comment lines, starting at the first one with @axiom
+LINE_COMMENT_BLOCK_PATTERN = re.compile(
+    r"(?://[^\n]*@axiom:[^\n]*\n)+(?://[^\n]*\n)*", re.MULTILINE
+)
+
+# /* ... */ block comment containing @axiom (never spanning past its own */)
+BLOCK_COMMENT_PATTERN = re.compile(r"/\*(?:[^*]|\*(?!/))*?@axiom:.*?\*/", re.DOTALL)
+
+# Either comment style, so a file is scanned for annotated comments in one pass
+ANNOTATED_COMMENT_PATTERN = re.compile(
+    f"{LINE_COMMENT_BLOCK_PATTERN.pattern}|{BLOCK_COMMENT_PATTERN.pattern}", re.DOTALL
+)
+
 # Pattern to find function declarations following annotations
 # Matches: optional whitespace, return type(s), function name, opening paren
 FUNCTION_DECL_PATTERN = re.compile(
@@ -32,6 +60,14 @@ FUNCTION_DECL_PATTERN = re.compile(
     re.MULTILINE,
 )
 
+AnnotatedFunctions = tuple[tuple[str, tuple[tuple[str, str], ...]], ...]
+
+# Annotated functions keyed by a digest of the source text, least recently used first.
+# Directory scans run in threads, so every access holds the lock.
+_ANNOTATED_FUNCTIONS_CACHE: OrderedDict[bytes, AnnotatedFunctions] = OrderedDict()
+_ANNOTATED_FUNCTIONS_CACHE_SIZE = 256
+_ANNOTATED_FUNCTIONS_LOCK = threading.Lock()
+
 
 def extract_pairings_from_comments(source_path: Path) -> tuple[list[Pairing], list[Idiom]]:
     """Parse specially formatted comments from source files.
@@ -46,28 +82,55 @@ def extract_pairings_from_comments(source_path: Path) -> tuple[list[Pairing], li
     Returns:
         Tuple of (pairings, idioms) extracted from comments
     """
+    if source_path.stat().st_size >= MMAP_PREFILTER_MIN_SIZE and not _contains_annotation(
+        source_path
+    ):
+        return [], []
+
     content = source_path.read_text()
-    pairings = []
-    idioms = []
+    if ANNOTATION_TAG not in content:
+        return [], []
 
-    # Find all comment blocks that contain @axiom annotations
-    # Match both // and /* */ style comments
-    comment_blocks = _find_annotated_comment_blocks(content)
+    return extract_pairings_from_source(content, source_path.name)
 
-    for _block_start, block_end, annotations in comment_blocks:
-        # Look for function declaration after this comment block
-        func_match = FUNCTION_DECL_PATTERN.search(content, block_end)
-        if not func_match:
-            continue
 
-        # Make sure the function follows closely after the comment
-        gap = content[block_end : func_match.start()]
-        if len(gap.strip()) > 0 and not gap.strip().startswith("//"):
-            # Too much content between comment and function
-            continue
+def _contains_annotation(source_path: Path) -> bool:
+    """Check for an @axiom: tag without decoding the file.
 
-        function_name = func_match.group(1)
-        ann_dict = {key.lower(): value.strip() for key, value in annotations}
+    The file is memory-mapped and searched as bytes, so large files with no
+    annotations are never read into a str.
+
+    Args:
+        source_path: Path to source file
+
+    Returns:
+        True if the file contains the @axiom: marker
+    """
+    with open(source_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            # mmap rejects empty files
+            return False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm.find(ANNOTATION_MARKER) != -1
+
+
+def extract_pairings_from_source(
+    content: str, source_name: str = "<source>"
+) -> tuple[list[Pairing], list[Idiom]]:
+    """Parse specially formatted comments from source text.
+
+    Args:
+        content: Source file content
+        source_name: Name used in pairing evidence (usually the file name)
+
+    Returns:
+        Tuple of (pairings, idioms) extracted from comments
+    """
+    pairings = []
+    idioms = []
+
+    for function_name, annotations in _find_annotated_functions(content):
+        ann_dict = dict(annotations)
 
         # Create pairing if pairs_with is specified
         if "pairs_with" in ann_dict:
@@ -81,7 +144,7 @@ def extract_pairings_from_comments(source_path: Path) -> tuple[list[Pairing], li
                     required=required,
                     source="comment_annotation",
                     confidence=1.0,
-                    evidence=f"@axiom:pairs_with in {source_path.name}",
+                    evidence=f"@axiom:pairs_with in {source_name}",
                 )
             )
 
@@ -101,35 +164,91 @@ def extract_pairings_from_comments(source_path: Path) -> tuple[list[Pairing], li
     return pairings, idioms
 
 
-def _find_annotated_comment_blocks(content: str) -> list[tuple[int, int, list[tuple[str, str]]]]:
-    """Find comment blocks containing @axiom annotations.
+def _find_annotated_functions(content: str) -> AnnotatedFunctions:
+    """Find functions declared directly after @axiom annotation blocks.
+
+    Memoized by a blake2b digest of the content, so re-scanning identical
+    source text skips the regex passes without the cache holding on to the
+    text itself. The cache is shared by scanning threads and guarded by a
+    lock; the scan itself runs outside it. Results are immutable; callers
+    build fresh Pairing and Idiom objects from them.
 
     Args:
         content: Source file content
 
     Returns:
-        List of (start_pos, end_pos, annotations) tuples
+        Tuple of (function_name, annotations) pairs, where annotations are
+        (lowercased key, stripped value) tuples in source order
     """
-    blocks = []
+    key = hashlib.blake2b(content.encode(), digest_size=16).digest()
+    with _ANNOTATED_FUNCTIONS_LOCK:
+        cached = _ANNOTATED_FUNCTIONS_CACHE.get(key)
+        if cached is not None:
+            _ANNOTATED_FUNCTIONS_CACHE.move_to_end(key)
+            return cached
 
-    # Find single-line comment sequences with @axiom
-    # Match consecutive // lines
-    single_line_pattern = re.compile(
-        r"((?://[^\n]*@axiom:[^\n]*\n)+(?://[^\n]*\n)*)", re.MULTILINE
-    )
+    functions = _scan_annotated_functions(content)
+    with _ANNOTATED_FUNCTIONS_LOCK:
+        _ANNOTATED_FUNCTIONS_CACHE[key] = functions
+        if len(_ANNOTATED_FUNCTIONS_CACHE) > _ANNOTATED_FUNCTIONS_CACHE_SIZE:
+            _ANNOTATED_FUNCTIONS_CACHE.popitem(last=False)
+    return functions
 
-    for match in single_line_pattern.finditer(content):
-        block_text = match.group(1)
-        annotations = AXIOM_TAG_PATTERN.findall(block_text)
-        if annotations:
-            blocks.append((match.start(), match.end(), annotations))
 
-    # Find block comments with @axiom
-    block_comment_pattern = re.compile(r"/\*.*?@axiom:.*?\*/", re.DOTALL)
+def _scan_annotated_functions(content: str) -> AnnotatedFunctions:
+    """Scan source text for functions declared after @axiom annotation blocks.
 
-    for match in block_comment_pattern.finditer(content):
-        block_text = match.group(0)
-        annotations = AXIOM_TAG_PATTERN.findall(block_text)
+    Args:
+        content: Source file content
+
+    Returns:
+        Tuple of (function_name, annotations) pairs, as for
+        _find_annotated_functions
+    """
+    functions = []
+
+    # Find all comment blocks that contain @axiom annotations
+    # Match both // and /* */ style comments
+    comment_blocks = _find_annotated_comment_blocks(content)
+
+    for _block_start, block_end, annotations in comment_blocks:
+        # Look for function declaration after this comment block
+        func_match = FUNCTION_DECL_PATTERN.search(content, block_end)
+        if not func_match:
+            continue
+
+        # Make sure the function follows closely after the comment
+        gap = content[block_end : func_match.start()]
+        if len(gap.strip()) > 0 and not gap.strip().startswith("//"):
+            # Too much content between comment and function
+            continue
+
+        functions.append((
+            func_match.group(1),
+            tuple((key.lower(), value.strip()) for key, value in annotations),
+        ))
+
+    return tuple(functions)
+
+
+def _find_annotated_comment_blocks(content: str) -> list[tuple[int, int, list[tuple[str, str]]]]:
+    """Find comment blocks containing @axiom annotations.
+
+    Both comment styles are matched in one pass, so blocks (and the pairings
+    and idioms built from them) come back in source order rather than all
+    // blocks before all /* */ blocks. A /* */ block ends at its first */.
+
+    Args:
+        content: Source file content
+
+    Returns:
+        List of (start_pos, end_pos, annotations) tuples, in source order
+    """
+    blocks = []
+
+    # Single-line // sequences and /* */ blocks, in source order
+    for match in ANNOTATED_COMMENT_PATTERN.finditer(content):
+        annotations = AXIOM_TAG_PATTERN.findall(match.group(0))
         if annotations:
             blocks.append((match.start(), match.end(), annotations))
 
@@ -137,13 +256,17 @@ def _find_annotated_comment_blocks(content: str) -> list[tuple[int, int, list[tu
 
 
 def scan_directory_for_annotations(
-    directory: Path, extensions: list[str] | None = None
+    directory: Path,
+    extensions: list[str] | None = None,
+    max_workers: int = 1,
 ) -> tuple[list[Pairing], list[Idiom]]:
     """Recursively scan directory for axiom annotations in source files.
 
     Args:
         directory: Root directory to scan
         extensions: File extensions to scan (default: .h, .hpp, .c, .cpp, .hxx, .cxx)
+        max_workers: Number of threads reading and parsing files (default: 1).
+            Results are returned in walk order regardless.
 
     Returns:
         Aggregated (pairings, idioms) from all source files
@@ -154,14 +277,57 @@ def scan_directory_for_annotations(
     all_pairings: list[Pairing] = []
     all_idioms: list[Idiom] = []
 
-    for ext in extensions:
-        for source_file in directory.rglob(f"*{ext}"):
-            try:
-                pairings, idioms = extract_pairings_from_comments(source_file)
-                all_pairings.extend(pairings)
-                all_idioms.extend(idioms)
-            except Exception:
-                # Skip files that can't be read (permissions, encoding issues)
-                pass
+    source_files = _iter_source_files(directory, tuple(extensions))
+    if max_workers > 1:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_scan_file, source_files))
+    else:
+        results = map(_scan_file, source_files)
+
+    for pairings, idioms in results:
+        all_pairings.extend(pairings)
+        all_idioms.extend(idioms)
 
     return all_pairings, all_idioms
+
+
+def _scan_file(source_file: Path) -> tuple[list[Pairing], list[Idiom]]:
+    """Extract annotations from one file, returning nothing if it can't be read."""
+    try:
+        return extract_pairings_from_comments(source_file)
+    except (OSError, UnicodeDecodeError):
+        # Skip files that can't be read (permissions, encoding issues)
+        return [], []
+
+
+def _iter_source_files(
+    directory: str | os.PathLike[str], extensions: tuple[str, ...]
+) -> Iterator[Path]:
+    """Walk directory once, yielding files whose names end with an extension.
+
+    Uses os.scandir so each entry's type comes from the directory listing
+    rather than a separate stat. Like Path.rglob, symlinked directories
+    are not descended into. Directories are walked as plain str paths;
+    only matching files are wrapped in Path.
+
+    Args:
+        directory: Root directory to walk
+        extensions: File extensions to match
+
+    Yields:
+        Paths of matching source files
+    """
+    try:
+        entries = os.scandir(directory)
+    except OSError:
+        return
+
+    with entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _iter_source_files(entry.path, extensions)
+                elif entry.name.endswith(extensions) and entry.is_file():
+                    yield Path(entry.path)
+            except OSError:
+                continue
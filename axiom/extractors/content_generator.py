@@ -7,6 +7,49 @@
 
 import hashlib
 import re
+from functools import lru_cache
+
+# K Framework standard citations, e.g.
+# /*@ \fromStandard{\source[n1570]{\para{X.X.X}{N}}}{TEXT}*/
+STANDARD_TEXT_PATTERN = re.compile(r'/\*@\s*\\fromStandard\{[^}]+\}\{([^}]+)\}\s*\*/')
+CINLINE_PATTERN = re.compile(r'\\cinline\{([^}]+)\}')
+UB_COMMENT_PATTERN = re.compile(
+    r'//\s*(.*(?:undefined behavior|the behavior is undefined).*)', re.IGNORECASE
+)
+
+# C standard section reference, e.g. \para{6.3.1.4}{1}
+PARA_PATTERN = re.compile(r'\\para\{([^}]+)\}\{([^}]+)\}')
+
+# Non-condition K text stripped before parsing: comments, syntax, endmodule, context
+K_NOISE_PATTERNS = (
+    re.compile(r'/\*@?[^*]*\*+(?:[^/*][^*]*\*+)*/'),
+    re.compile(r'//[^\n]*'),
+    re.compile(r'syntax\s+\w+\s*::=\s*[^\n]+'),
+    re.compile(r'\s*endmodule\s*'),
+    re.compile(r'context\s+[^\n]+'),
+)
+
+# Boolean connectives that split a requires clause into conditions
+AND_BOOL_PATTERN = re.compile(r"\s+andBool\s+")
+OR_BOOL_PATTERN = re.compile(r"\s+orBool\s+")
+
+# K sort annotations and context HOLE markers removed for display
+SORT_ANNOTATION_PATTERN = re.compile(r'::(?:UType|CValue|Type|KItem)')
+VALUE_SORT_PATTERN = re.compile(r':(?:Int|Float|Bool|K)\b')
+HOLE_PATTERN = re.compile(r'HOLE\s*=>\s*\w+\([^)]*\)')
+
+
+@lru_cache(maxsize=4096)
+def _generate_cached(
+    generator_cls: type["ContentGenerator"], formal_spec: str, operation: str | None
+) -> str:
+    """Memoized ContentGenerator.generate, shared across generator instances.
+
+    Generators are stateless and usually created per K file, while the same
+    requires clauses recur across files. Keying on the class keeps
+    subclasses with different templates separate.
+    """
+    return generator_cls()._generate(formal_spec, operation)
 
 
 class ContentGenerator:
@@ -121,6 +164,9 @@ class ContentGenerator:
         "notBool hasInt": "must not contain integer",
     }
 
+    # Templates checked longest pattern first, so specific predicates win
+    _TEMPLATES_BY_LENGTH = sorted(PREDICATE_TEMPLATES.items(), key=lambda x: -len(x[0]))
+
     # Operation name mappings
     OPERATION_NAMES = {
         "division": "Integer division",
@@ -156,6 +202,18 @@ class ContentGenerator:
         if not formal_spec:
             return "No preconditions specified."
 
+        return _generate_cached(type(self), formal_spec, operation)
+
+    def _generate(self, formal_spec: str, operation: str | None) -> str:
+        """Generate content for a non-empty formal spec (uncached).
+
+        Args:
+            formal_spec: K requires clause (may include C standard comments).
+            operation: Optional operation name for context.
+
+        Returns:
+            Human-readable description.
+        """
         # First, try to extract C standard text from comments
         standard_text = self._extract_standard_text(formal_spec)
         if standard_text:
@@ -197,19 +255,15 @@ class ContentGenerator:
         Returns:
             Extracted standard text if found, None otherwise.
         """
-        # Pattern for K Framework standard citations
-        # Matches: /*@ \fromStandard{\source[n1570]{\para{X.X.X}{N}}}{TEXT}*/
-        pattern = r'/\*@\s*\\fromStandard\{[^}]+\}\{([^}]+)\}\s*\*/'
-        match = re.search(pattern, formal_spec)
+        match = STANDARD_TEXT_PATTERN.search(formal_spec)
         if match:
             text = match.group(1).strip()
             # Clean up inline C code markers
-            text = re.sub(r'\\cinline\{([^}]+)\}', r'`\1`', text)
+            text = CINLINE_PATTERN.sub(r'`\1`', text)
             return text
 
         # Also check for simpler comment patterns with UB descriptions
-        ub_pattern = r'//\s*(.*(?:undefined behavior|the behavior is undefined).*)'
-        match = re.search(ub_pattern, formal_spec, re.IGNORECASE)
+        match = UB_COMMENT_PATTERN.search(formal_spec)
         if match:
             return match.group(1).strip()
 
@@ -224,16 +278,9 @@ class ContentGenerator:
         Returns:
             Specification without comments.
         """
-        # Remove /*@ ... */ comments
-        spec = re.sub(r'/\*@?[^*]*\*+(?:[^/*][^*]*\*+)*/', '', spec)
-        # Remove // comments to end of line
-        spec = re.sub(r'//[^\n]*', '', spec)
-        # Remove syntax declarations
-        spec = re.sub(r'syntax\s+\w+\s*::=\s*[^\n]+', '', spec)
-        # Remove endmodule markers
-        spec = re.sub(r'\s*endmodule\s*', '', spec)
-        # Remove context declarations
-        spec = re.sub(r'context\s+[^\n]+', '', spec)
+        # Comments, syntax declarations, endmodule markers, context declarations
+        for pattern in K_NOISE_PATTERNS:
+            spec = pattern.sub('', spec)
         return spec.strip()
 
     def parse_conditions(self, formal_spec: str) -> list[str]:
@@ -252,7 +299,7 @@ class ContentGenerator:
         spec = " ".join(formal_spec.split())
 
         # Split on 'andBool' first
-        parts = re.split(r"\s+andBool\s+", spec)
+        parts = AND_BOOL_PATTERN.split(spec)
 
         conditions = []
         for part in parts:
@@ -293,7 +340,7 @@ class ContentGenerator:
 
         # Handle orBool conditions first
         if " orBool " in condition:
-            parts = re.split(r"\s+orBool\s+", condition)
+            parts = OR_BOOL_PATTERN.split(condition)
             described = [self._describe_condition(p.strip()) for p in parts]
             described = [d for d in described if d]
             if len(described) == 2:
@@ -321,10 +368,7 @@ class ContentGenerator:
                     return f"exactly one of ({left}) or ({right})"
 
         # Check against known templates (order matters - check specific first)
-        for pattern, description in sorted(
-            self.PREDICATE_TEMPLATES.items(),
-            key=lambda x: -len(x[0]),  # Longer patterns first
-        ):
+        for pattern, description in self._TEMPLATES_BY_LENGTH:
             if pattern in condition:
                 return description
 
@@ -360,8 +404,8 @@ class ContentGenerator:
             spec = spec[1:-1].strip()
 
         # Replace K-specific type annotations
-        spec = re.sub(r'::(?:UType|CValue|Type|KItem)', '', spec)
-        spec = re.sub(r':(?:Int|Float|Bool|K)\b', '', spec)
+        spec = SORT_ANNOTATION_PATTERN.sub('', spec)
+        spec = VALUE_SORT_PATTERN.sub('', spec)
 
         # Replace K operators with readable versions
         spec = spec.replace("=/=K", "≠")
@@ -375,7 +419,7 @@ class ContentGenerator:
         spec = spec.replace("<=Quals", "qualifiers ⊆")
 
         # Clean up HOLE markers from contexts
-        spec = re.sub(r'HOLE\s*=>\s*\w+\([^)]*\)', '', spec)
+        spec = HOLE_PATTERN.sub('', spec)
 
         return spec.strip()
 
@@ -420,9 +464,7 @@ class ContentGenerator:
         Returns:
             C standard reference like "6.3.1.4/1" if found.
         """
-        # Pattern: \para{6.3.1.4}{1}
-        pattern = r'\\para\{([^}]+)\}\{([^}]+)\}'
-        match = re.search(pattern, formal_spec)
+        match = PARA_PATTERN.search(formal_spec)
         if match:
             section = match.group(1)
             para = match.group(2)
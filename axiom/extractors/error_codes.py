@@ -6,11 +6,31 @@
 """Parser for Error_Codes.csv from c-semantics."""
 
 import csv
+from functools import lru_cache
 from pathlib import Path
 
 from axiom.models import ErrorCode, ErrorType
 
 
+@lru_cache(maxsize=8)
+def _read_rows(csv_path: str, mtime_ns: int) -> tuple[tuple[str, ...], ...]:
+    """Read CSV rows once per (path, mtime).
+
+    The modification time is part of the cache key so an edited file is
+    re-read. Rows are returned as immutable tuples; ErrorCode objects are
+    built fresh by each parse() since callers (e.g. the linker) mutate them.
+
+    Args:
+        csv_path: Path to the CSV file.
+        mtime_ns: File modification time in nanoseconds.
+
+    Returns:
+        Tuple of CSV rows.
+    """
+    with open(csv_path, encoding="utf-8") as f:
+        return tuple(tuple(row) for row in csv.reader(f))
+
+
 class ErrorCodesParser:
     """Parse the Error_Codes.csv file from c-semantics."""
 
@@ -21,6 +41,8 @@ class ErrorCodesParser:
         "Unspecified Behavior": ErrorType.UNSPECIFIED,
     }
 
+    VALID_PREFIXES = ("UB-", "CV-", "USP-", "IMPL-", "SE-", "L-", "IMPLUB-")
+
     def __init__(self, csv_path: Path) -> None:
         """Initialize parser with path to CSV file.
 
@@ -37,17 +59,15 @@ class ErrorCodesParser:
         """
         error_codes: list[ErrorCode] = []
 
-        with open(self.csv_path, encoding="utf-8") as f:
-            reader = csv.reader(f)
-
-            for row in reader:
-                error_code = self._parse_row(row)
-                if error_code:
-                    error_codes.append(error_code)
+        rows = _read_rows(str(self.csv_path), self.csv_path.stat().st_mtime_ns)
+        for row in rows:
+            error_code = self._parse_row(row)
+            if error_code:
+                error_codes.append(error_code)
 
         return error_codes
 
-    def _parse_row(self, row: list[str]) -> ErrorCode | None:
+    def _parse_row(self, row: tuple[str, ...] | list[str]) -> ErrorCode | None:
         """Parse a single CSV row.
 
         Args:
@@ -95,8 +115,7 @@ class ErrorCodesParser:
         Returns:
             True if code matches expected pattern.
         """
-        valid_prefixes = ("UB-", "CV-", "USP-", "IMPL-", "SE-", "L-", "IMPLUB-")
-        return code.startswith(valid_prefixes)
+        return code.startswith(self.VALID_PREFIXES)
 
     def _extract_internal_code(self, code: str) -> str:
         """Extract internal code from full error code.
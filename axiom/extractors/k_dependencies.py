@@ -11,7 +11,9 @@ This module provides two-pass extraction from K semantics:
 """
 
 import re
+import sys
 from collections import defaultdict
+from itertools import chain
 from pathlib import Path
 
 from axiom.extractors.k_semantics import KSemanticsExtractor
@@ -19,7 +21,7 @@ from axiom.models import Axiom
 
 # K primitive functions to exclude from dependency tracking
 # These are K framework internals, not semantic C/C++ functions
-K_PRIMITIVES: set[str] = {
+K_PRIMITIVES: frozenset[str] = frozenset({
     # Type wrappers
     "tv",
     "utype",
@@ -67,14 +69,14 @@ K_PRIMITIVES: set[str] = {
     "isNull",
     "isNativeLoc",
     "NullPointer",
-}
+})
 
 # Regex to find function calls: word followed by (
-# Excludes patterns like +Int, *Int which are infix operators
-FUNCTION_CALL_PATTERN = re.compile(r"\b([a-zA-Z_][a-zA-Z0-9_]*)\s*\(")
-
-# Regex to extract function name from builtin("funcName", ...)
-BUILTIN_PATTERN = re.compile(r'builtin\s*\(\s*"([^"]+)"')
+# Excludes patterns like +Int, *Int which are infix operators.
+# Also captures a leading string argument, so builtin("funcName", ...)
+# targets come from the same scan. The string is matched in a lookahead,
+# so calls inside it are still found.
+FUNCTION_CALL_PATTERN = re.compile(r'\b([a-zA-Z_][a-zA-Z0-9_]*)\s*\((?=\s*"([^"]+)")?')
 
 
 def extract_function_calls(rhs: str) -> list[str]:
@@ -85,22 +87,19 @@ def extract_function_calls(rhs: str) -> list[str]:
 
     Returns:
         List of unique function names called (excluding K primitives).
+        Names are interned, since the same few recur across every rule.
     """
     if not rhs:
         return []
 
     calls: set[str] = set()
 
-    # Find all function call patterns: name(
-    for match in FUNCTION_CALL_PATTERN.finditer(rhs):
-        name = match.group(1)
+    # Find all function call patterns: name(, and builtin("name", ...) targets
+    for name, string_arg in FUNCTION_CALL_PATTERN.findall(rhs):
         if name not in K_PRIMITIVES:
-            calls.add(name)
-
-    # Also extract function names from builtin("name", ...) patterns
-    for match in BUILTIN_PATTERN.finditer(rhs):
-        name = match.group(1)
-        calls.add(name)
+            calls.add(sys.intern(name))
+        if name == "builtin" and string_arg:
+            calls.add(sys.intern(string_arg))
 
     return sorted(calls)
 
@@ -117,8 +116,9 @@ def build_function_index(axioms: list[Axiom]) -> dict[str, list[str]]:
     index: dict[str, list[str]] = defaultdict(list)
 
     for axiom in axioms:
-        if axiom.function:
-            index[axiom.function].append(axiom.id)
+        function = axiom.function
+        if function:
+            index[sys.intern(function)].append(axiom.id)
 
     return dict(index)
 
@@ -131,15 +131,10 @@ def resolve_depends_on(calls: list[str], index: dict[str, list[str]]) -> list[st
         index: Function name to axiom ID mapping.
 
     Returns:
-        List of axiom IDs that the caller depends on.
+        List of axiom IDs that the caller depends on, without duplicates,
+        in first-seen order.
     """
-    deps: list[str] = []
-
-    for func in calls:
-        if func in index:
-            deps.extend(index[func])
-
-    return deps
+    return list(dict.fromkeys(chain.from_iterable(index.get(func, ()) for func in calls)))
 
 
 class KDependencyExtractor:
@@ -150,13 +145,24 @@ class KDependencyExtractor:
     2. Build function->axiom index and resolve depends_on for each axiom
     """
 
-    def __init__(self, semantics_root: Path) -> None:
+    def __init__(
+        self,
+        semantics_root: Path,
+        max_workers: int | None = 1,
+        cache_dir: Path | None = None,
+    ) -> None:
         """Initialize extractor.
 
         Args:
             semantics_root: Root directory of K semantics (e.g., semantics/c).
+            max_workers: Number of processes parsing K files (default: 1),
+                or None for one per CPU.
+            cache_dir: Optional persistent parse cache directory, see
+                KSemanticsExtractor.
         """
         self.semantics_root = Path(semantics_root)
+        self.max_workers = max_workers
+        self.cache_dir = cache_dir
 
     def extract_with_dependencies(
         self, base_index: dict[str, list[str]] | None = None
@@ -171,18 +177,15 @@ class KDependencyExtractor:
             List of axioms with depends_on populated.
         """
         # Pass 1: Extract all axioms and collect RHS for each
-        extractor = KSemanticsExtractor(self.semantics_root)
-        axioms = extractor.extract_all()
+        extractor = KSemanticsExtractor(self.semantics_root, cache_dir=self.cache_dir)
+        axioms = extractor.extract_all(max_workers=self.max_workers)
 
         # Build function index (merged with base_index if provided)
         index = build_function_index(axioms)
         if base_index:
             # Merge base_index into current index (base takes precedence for shared keys)
             for func, axiom_ids in base_index.items():
-                if func in index:
-                    index[func].extend(axiom_ids)
-                else:
-                    index[func] = list(axiom_ids)
+                index.setdefault(func, []).extend(axiom_ids)
 
         # Pass 2: For each axiom, parse RHS and resolve depends_on
         # We need to re-parse to get the RHS
@@ -211,8 +214,8 @@ class KDependencyExtractor:
         Returns:
             Dictionary mapping function names to axiom IDs.
         """
-        extractor = KSemanticsExtractor(self.semantics_root)
-        axioms = extractor.extract_all()
+        extractor = KSemanticsExtractor(self.semantics_root, cache_dir=self.cache_dir)
+        axioms = extractor.extract_all(max_workers=self.max_workers)
         return build_function_index(axioms)
 
     def _build_axiom_rhs_map(self, extractor: KSemanticsExtractor) -> dict[str, str]:
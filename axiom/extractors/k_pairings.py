@@ -17,6 +17,8 @@ These functions are paired via the shared <malloced> cell.
 """
 
 import re
+import sys
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from axiom.models.pairing import Pairing
@@ -51,21 +53,38 @@ CELL_ACCESS_PATTERN = re.compile(
     re.DOTALL,
 )
 
-# Naming patterns for heuristic pairing detection (C-style)
-NAMING_PATTERNS: list[tuple[str, str]] = [
-    (r"(.+)_begin$", r"\1_end"),
-    (r"(.+)_start$", r"\1_stop"),
-    (r"(.+)_open$", r"\1_close"),
-    (r"(.+)_lock$", r"\1_unlock"),
-    (r"(.+)_init$", r"\1_destroy"),
-    (r"(.+)_init$", r"\1_cleanup"),
-    (r"(.+)_init$", r"\1_free"),
-    (r"(.+)_init$", r"\1_finish"),
-    (r"(.+)_acquire$", r"\1_release"),
-    (r"^create_(.+)$", r"destroy_\1"),
-    (r"^alloc_(.+)$", r"free_\1"),
-    (r"^new_(.+)$", r"delete_\1"),
-]
+# Internal K configuration cells, never evidence of a pairing
+INTERNAL_CELLS: frozenset[str] = frozenset({"k", "K", "T", "thread", "threads"})
+
+# Whitespace runs, collapsed before scanning so rules that differ only in
+# layout share one memoized scan (the cell patterns treat any run alike)
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# Cell patterns in precedence order, with their access type and the substrings
+# any match must contain. A pass is skipped when the text lacks one of them.
+CELL_PATTERNS: tuple[tuple[re.Pattern[str], str, tuple[str, ...]], ...] = (
+    (CELL_WRITE_PATTERN, "write", ("</", ".Map", "=>")),
+    (CELL_REMOVE_PATTERN, "remove", ("</", "|->", "=>", ".Map")),
+    (CELL_MODIFY_PATTERN, "modify", ("</", "|->", "=>")),
+    (CELL_ACCESS_PATTERN, "read", ("</",)),
+)
+
+# Naming conventions for heuristic pairing detection (C-style), keyed by the
+# opener's affix: X_begin pairs with X_end, create_X with destroy_X, etc.
+# A name has one last and one first "_" segment, so each lookup is direct.
+NAMING_SUFFIX_CLOSERS: dict[str, tuple[str, ...]] = {
+    "begin": ("end",),
+    "start": ("stop",),
+    "open": ("close",),
+    "lock": ("unlock",),
+    "init": ("destroy", "cleanup", "free", "finish"),
+    "acquire": ("release",),
+}
+NAMING_PREFIX_CLOSERS: dict[str, tuple[str, ...]] = {
+    "create": ("destroy",),
+    "alloc": ("free",),
+    "new": ("delete",),
+}
 
 # C++ stdlib specific pairings (not detectable by naming patterns alone)
 # These are semantic pairings based on C++ standard library design
@@ -111,38 +130,37 @@ def extract_cell_patterns(text: str) -> list[tuple[str, str]]:
         - "modify": Modifying cell contents ((X => Y) |->)
         - "read": Reading/checking cell (in_keys, etc.)
     """
+    return list(_cell_patterns(text))
+
+
+@lru_cache(maxsize=4096)
+def _cell_patterns(text: str) -> tuple[tuple[str, str], ...]:
+    """Memoized cell access scan for extract_cell_patterns.
+
+    Rules in a K corpus repeat the same cell fragments, so identical text
+    skips the regex passes. Results are immutable; callers get a fresh list.
+
+    Args:
+        text: K rule text.
+
+    Returns:
+        Tuple of (cell_name, access_type) pairs in precedence order.
+    """
     patterns: list[tuple[str, str]] = []
     seen_cells: set[str] = set()
 
-    # Check for write pattern: .Map => X
-    for match in CELL_WRITE_PATTERN.finditer(text):
-        cell_name = match.group(1)
-        if cell_name not in seen_cells:
-            patterns.append((cell_name, "write"))
-            seen_cells.add(cell_name)
-
-    # Check for remove pattern: X |-> _ => .Map
-    for match in CELL_REMOVE_PATTERN.finditer(text):
-        cell_name = match.group(1)
-        if cell_name not in seen_cells:
-            patterns.append((cell_name, "remove"))
-            seen_cells.add(cell_name)
-
-    # Check for modify pattern: (X => Y) |->
-    for match in CELL_MODIFY_PATTERN.finditer(text):
-        cell_name = match.group(1)
-        if cell_name not in seen_cells:
-            patterns.append((cell_name, "modify"))
-            seen_cells.add(cell_name)
-
-    # Check for general cell access (read)
-    for match in CELL_ACCESS_PATTERN.finditer(text):
-        cell_name = match.group(1)
-        if cell_name not in seen_cells:
-            patterns.append((cell_name, "read"))
-            seen_cells.add(cell_name)
-
-    return patterns
+    # Each cell takes the access type of the first pattern that matches it
+    for pattern, access_type, required in CELL_PATTERNS:
+        if not all(token in text for token in required):
+            continue
+        for match in pattern.finditer(text):
+            # Interned: the same few cell names key every pairing dict
+            cell_name = sys.intern(match.group(1))
+            if cell_name not in seen_cells:
+                patterns.append((cell_name, access_type))
+                seen_cells.add(cell_name)
+
+    return tuple(patterns)
 
 
 def extract_pairings_from_rules(rules: list["ParsedRule"]) -> list[Pairing]:
@@ -166,13 +184,16 @@ def extract_pairings_from_rules(rules: list["ParsedRule"]) -> list[Pairing]:
         if not rule.function:
             continue
 
-        # Combine LHS and RHS for pattern matching
+        # Combine LHS and RHS for pattern matching; text without a closing
+        # cell tag can't match, so skip normalizing it
         text = f"{rule.lhs or ''} {rule.rhs or ''}"
-        patterns = extract_cell_patterns(text)
+        if "</" not in text:
+            continue
+        patterns = extract_cell_patterns(WHITESPACE_PATTERN.sub(" ", text))
 
         for cell_name, access_type in patterns:
             # Skip internal K cells
-            if cell_name in {"k", "K", "T", "thread", "threads"}:
+            if cell_name in INTERNAL_CELLS:
                 continue
 
             if access_type == "write":
@@ -253,6 +274,25 @@ def extract_pairings_from_rules(rules: list["ParsedRule"]) -> list[Pairing]:
     return pairings
 
 
+def index_pairings(pairings: list[Pairing]) -> dict[tuple[str, str], Pairing]:
+    """Index pairings by their (opener_id, closer_id) pair.
+
+    Lets callers look up a specific pairing directly instead of scanning the
+    list for it.
+
+    Args:
+        pairings: Pairings as returned by the extract/detect functions.
+
+    Returns:
+        Dictionary mapping (opener_id, closer_id) to the first pairing with
+        those IDs.
+    """
+    index: dict[tuple[str, str], Pairing] = {}
+    for pairing in pairings:
+        index.setdefault((pairing.opener_id, pairing.closer_id), pairing)
+    return index
+
+
 def detect_naming_pairings(function_names: list[str]) -> list[Pairing]:
     """Detect pairings based on function naming conventions.
 
@@ -272,24 +312,27 @@ def detect_naming_pairings(function_names: list[str]) -> list[Pairing]:
     func_set = set(function_names)
 
     for func in function_names:
-        for opener_pattern, closer_pattern in NAMING_PATTERNS:
-            match = re.match(opener_pattern, func)
-            if match:
-                # Build the expected closer name
-                base = match.group(1)
-                expected_closer = re.sub(r"\\1", base, closer_pattern)
-
-                if expected_closer in func_set:
-                    pairings.append(
-                        Pairing(
-                            opener_id=f"axiom_for_{func}",
-                            closer_id=f"axiom_for_{expected_closer}",
-                            required=True,
-                            source="naming_heuristic",
-                            confidence=0.7,
-                            evidence=f"Naming pattern: {func} -> {expected_closer}",
-                        )
+        # Expected closer names: X_<closer> for X_<opener>, then
+        # <closer>_X for <opener>_X
+        base, _, suffix = func.rpartition("_")
+        prefix, _, rest = func.partition("_")
+        expected_closers = [
+            *(f"{base}_{closer}" for closer in NAMING_SUFFIX_CLOSERS.get(suffix, ()) if base),
+            *(f"{closer}_{rest}" for closer in NAMING_PREFIX_CLOSERS.get(prefix, ()) if rest),
+        ]
+
+        for expected_closer in expected_closers:
+            if expected_closer in func_set:
+                pairings.append(
+                    Pairing(
+                        opener_id=f"axiom_for_{func}",
+                        closer_id=f"axiom_for_{expected_closer}",
+                        required=True,
+                        source="naming_heuristic",
+                        confidence=0.7,
+                        evidence=f"Naming pattern: {func} -> {expected_closer}",
                     )
+                )
 
     return pairings
 
@@ -7,7 +7,13 @@
 
 from __future__ import annotations
 
+import concurrent.futures
+import contextlib
+import hashlib
+import os
+import pickle
 import re
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -46,7 +52,7 @@ MODULE_TO_HEADER: dict[str, str] = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorMarker:
     """Error marker extracted from a K rule."""
 
@@ -55,7 +61,7 @@ class ErrorMarker:
     message: str  # e.g., "Division by 0."
 
 
-@dataclass
+@dataclass(slots=True)
 class StandardRef:
     """C standard reference extracted from K comments."""
 
@@ -65,7 +71,7 @@ class StandardRef:
     text: str  # The standard text from the comment
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedRule:
     """A parsed K rule."""
 
@@ -119,24 +125,105 @@ class KSemanticsExtractor:
     # Comment block pattern: /*@ ... */
     COMMENT_BLOCK_PATTERN = re.compile(r"/\*@(.*?)\*/", re.DOTALL)
 
-    def __init__(self, semantics_root: Path) -> None:
+    # Part of every on-disk parse cache key; bump when parsing output changes
+    PARSE_CACHE_VERSION = "2"
+
+    def __init__(self, semantics_root: Path, cache_dir: Path | None = None) -> None:
         """Initialize extractor with path to semantics directory.
 
         Args:
             semantics_root: Root directory of K semantics files.
+            cache_dir: Optional directory for a persistent, content-addressed
+                cache of parsed rules, shared across runs.
         """
         self.semantics_root = Path(semantics_root)
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        # Parsed rules per file, keyed by path and tagged with the file's mtime
+        self._parse_cache: dict[Path, tuple[int, list[ParsedRule]]] = {}
 
     def parse_file(self, k_file: Path) -> list[ParsedRule]:
         """Parse a single K file and extract rules.
 
+        Results are cached on the extractor, so a file that is parsed again
+        (e.g. by KDependencyExtractor's second pass) is only read once.
+        Editing the file invalidates its entry.
+
         Args:
             k_file: Path to .k file.
 
         Returns:
             List of parsed rules.
         """
-        content = k_file.read_text(encoding="utf-8")
+        mtime_ns = k_file.stat().st_mtime_ns
+        cached = self._parse_cache.get(k_file)
+        if cached is not None and cached[0] == mtime_ns:
+            return list(cached[1])
+
+        if self.cache_dir is None:
+            rules = self._parse_content(k_file.read_text(encoding="utf-8"), k_file)
+        else:
+            rules = self._parse_with_disk_cache(k_file)
+        self._parse_cache[k_file] = (mtime_ns, rules)
+        return list(rules)
+
+    def _parse_with_disk_cache(self, k_file: Path) -> list[ParsedRule]:
+        """Parse a K file, reusing rules pickled under cache_dir.
+
+        Entries are keyed by a hash of the parser version, the file name
+        (recorded in each rule) and the file bytes, so an edited file misses
+        and identical files share one entry. Entries that fail to load are
+        removed and re-parsed, and failed writes are ignored.
+
+        Args:
+            k_file: Path to .k file.
+
+        Returns:
+            List of parsed rules.
+        """
+        digest = hashlib.blake2b(self.PARSE_CACHE_VERSION.encode(), digest_size=20)
+        digest.update(k_file.name.encode() + b"\0")
+        # Hash and parse the same bytes, so an entry never holds rules from
+        # content other than its key's
+        data = k_file.read_bytes()
+        digest.update(data)
+        key = digest.hexdigest()
+        cache_path = self.cache_dir / key[:2] / key
+
+        try:
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            pass
+        except Exception:
+            # Truncated, stale or foreign entry (e.g. ParsedRule changed
+            # without a version bump): drop it and re-parse
+            with contextlib.suppress(OSError):
+                cache_path.unlink()
+
+        rules = self._parse_content(data.decode("utf-8"), k_file)
+
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write then rename, so concurrent readers never see a partial entry
+            tmp_path = cache_path.with_name(f"{key}.{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump(rules, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+
+        return rules
+
+    def _parse_content(self, content: str, k_file: Path) -> list[ParsedRule]:
+        """Parse K file content into rules.
+
+        Args:
+            content: Text of the .k file.
+            k_file: Path the content was read from.
+
+        Returns:
+            List of parsed rules.
+        """
         module_name = self._extract_module_name(content)
         source_file = str(k_file.name)
 
@@ -158,7 +245,8 @@ class KSemanticsExtractor:
         """Extract module name from K file content."""
         match = self.MODULE_PATTERN.search(content)
         if match:
-            return match.group(1)
+            # Interned: every rule and axiom from the file shares the name
+            return sys.intern(match.group(1))
         return "UNKNOWN"
 
     def _split_into_rules(self, content: str) -> list[tuple]:
@@ -298,12 +386,15 @@ class KSemanticsExtractor:
         r"(?:<[^>]+>\s*)?([a-zA-Z_][a-zA-Z0-9_]*)\s*\("
     )
 
+    # K primitives and cell names that head an LHS but aren't functions
+    LHS_NON_FUNCTIONS: frozenset[str] = frozenset({"tv", "utype", "type", "lval", "reval", "K"})
+
     def _extract_function_name(self, block: str) -> str | None:
         """Extract function name from builtin("name", ...) or LHS pattern."""
         # First try builtin("name", ...) pattern
         match = self.BUILTIN_PATTERN.search(block)
         if match:
-            return match.group(1)
+            return sys.intern(match.group(1))
 
         # Try to extract from LHS pattern like "alignedAlloc(Align, Sz)"
         # Find the rule keyword and extract what comes after
@@ -315,8 +406,8 @@ class KSemanticsExtractor:
             if func_match:
                 func_name = func_match.group(1)
                 # Skip K primitives and cell names
-                if func_name not in {"tv", "utype", "type", "lval", "reval", "K"}:
-                    return func_name
+                if func_name not in self.LHS_NON_FUNCTIONS:
+                    return sys.intern(func_name)
 
         return None
 
@@ -544,15 +635,47 @@ class KSemanticsExtractor:
 
         return axioms
 
-    def extract_all(self) -> list[Axiom]:
+    def extract_all(self, max_workers: int | None = 1) -> list[Axiom]:
         """Extract axioms from all K files in the semantics directory.
 
+        Args:
+            max_workers: Number of processes parsing files (default: 1), or
+                None for one per CPU. Never more processes than files are
+                started, and a single file is parsed in this process.
+                Results are returned in walk order regardless, and the
+                parsed rules are kept in this extractor's parse cache.
+
         Returns:
             List of all extracted Axiom objects.
         """
         axioms: list[Axiom] = []
 
-        for k_file in self.semantics_root.rglob("*.k"):
+        k_files = list(self.semantics_root.rglob("*.k"))
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        workers = min(max_workers, len(k_files))
+
+        if workers > 1:
+            # A few chunks per worker keeps them evenly loaded
+            chunksize = max(1, len(k_files) // (workers * 4))
+            with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(
+                    _extract_file,
+                    [self.semantics_root] * len(k_files),
+                    k_files,
+                    [self.cache_dir] * len(k_files),
+                    chunksize=chunksize,
+                )
+                for k_file, (cached, file_axioms, error) in zip(k_files, results, strict=True):
+                    if error is not None:
+                        print(f"Warning: Failed to parse {k_file}: {error}")
+                        continue
+                    if cached is not None:
+                        self._parse_cache[k_file] = cached
+                    axioms.extend(file_axioms)
+            return axioms
+
+        for k_file in k_files:
             try:
                 file_axioms = self.extract_axioms_from_file(k_file)
                 axioms.extend(file_axioms)
@@ -669,3 +792,25 @@ class KSemanticsExtractor:
                 print(f"Warning: Failed to parse {k_file}: {e}")
 
         return extract_pairings_from_rules(all_rules)
+
+
+def _extract_file(
+    semantics_root: Path, k_file: Path, cache_dir: Path | None = None
+) -> tuple[tuple[int, list[ParsedRule]] | None, list[Axiom], str | None]:
+    """Extract axioms from one K file in a worker process.
+
+    Args:
+        semantics_root: Root directory of K semantics files.
+        k_file: Path to .k file.
+        cache_dir: Optional persistent parse cache directory.
+
+    Returns:
+        Tuple of (parse cache entry, axioms, error message). On failure the
+        cache entry is None, axioms is empty and the error is set.
+    """
+    extractor = KSemanticsExtractor(semantics_root, cache_dir=cache_dir)
+    try:
+        axioms = extractor.extract_axioms_from_file(k_file)
+    except Exception as e:
+        return None, [], str(e)
+    return extractor._parse_cache.get(k_file), axioms, None
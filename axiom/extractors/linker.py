@@ -5,9 +5,124 @@
 
 """Link axioms to error codes based on shared formal specifications."""
 
+import re
+import sys
+from collections import defaultdict
+from functools import lru_cache
+
+import numpy as np
 
 from axiom.models import Axiom, AxiomCollection, ErrorCode, ViolationRef
 
+# Key K predicates shared between axioms and the error rules that violate them
+KNOWN_PREDICATES = (
+    "isPromoted",
+    "isZero",
+    "isUnknown",
+    "==Type",
+    "=/=Type",
+    "isPointer",
+    "isInteger",
+    "hasIntegerType",
+    "isFloat",
+    "isComplete",
+    "isConst",
+)
+
+# All predicates in one alternation, scanned in a single pass. The lookahead
+# reports a match at every position, so overlapping occurrences are found
+# just as with a substring test per predicate.
+KNOWN_PREDICATE_PATTERN = re.compile(
+    "(?=(" + "|".join(re.escape(p) for p in KNOWN_PREDICATES) + "))"
+)
+
+# Error-description terms and the substrings that indicate them
+ERROR_TERM_PATTERNS: dict[str, tuple[str, ...]] = {
+    "division": ("division", "divide", "/"),
+    "modulus": ("modulus", "modulo", "%", "remainder"),
+    "overflow": ("overflow",),
+    "zero": ("zero", "0"),
+    "pointer": ("pointer",),
+    "integer": ("integer", "int"),
+    "float": ("float", "floating"),
+    "type": ("type",),
+    "conversion": ("conversion", "convert"),
+    "shift": ("shift", "<<", ">>"),
+}
+
+# Error terms inferred from an axiom's lowercased formal spec, and the
+# substrings that indicate them
+AXIOM_SPEC_TERM_PATTERNS: dict[str, tuple[str, ...]] = {
+    "zero": ("zero",),
+    "pointer": ("pointer",),
+    "integer": ("integer", "int"),
+    "float": ("float",),
+    "type": ("type",),
+}
+
+# One bit per error term. Error terms are a closed vocabulary, so the terms
+# an axiom shares with an error are the set bits of their masks' AND.
+ERROR_TERM_BITS: dict[str, int] = {term: 1 << i for i, term in enumerate(ERROR_TERM_PATTERNS)}
+
+
+def _term_mask(terms: frozenset[str]) -> int:
+    """Encode the error-vocabulary terms in a set as a bitmask."""
+    mask = 0
+    for term in terms:
+        mask |= ERROR_TERM_BITS.get(term, 0)
+    return mask
+
+
+# Specs, error descriptions and tag lists recur across axioms and error
+# codes, so term extraction is memoized on the input strings. Results are
+# frozensets so cached values can't be mutated by callers, and their
+# strings are interned so equal terms are shared across all the sets.
+@lru_cache(maxsize=4096)
+def _predicates_in(spec: str) -> frozenset[str]:
+    """Extract key predicates from a K specification."""
+    return frozenset(map(sys.intern, KNOWN_PREDICATE_PATTERN.findall(spec)))
+
+
+@lru_cache(maxsize=4096)
+def _error_terms_in(description: str) -> frozenset[str]:
+    """Extract key terms from an error description."""
+    desc_lower = description.lower()
+
+    return frozenset(
+        term
+        for term, patterns in ERROR_TERM_PATTERNS.items()
+        if any(p in desc_lower for p in patterns)
+    )
+
+
+@lru_cache(maxsize=4096)
+def _error_term_mask(description: str) -> int:
+    """Bitmask of the terms in an error description."""
+    return _term_mask(_error_terms_in(description))
+
+
+@lru_cache(maxsize=4096)
+def _axiom_terms_in(formal_spec: str, tags: tuple[str, ...]) -> frozenset[str]:
+    """Extract key terms from an axiom's formal spec and tags."""
+    # From tags
+    terms = set(map(sys.intern, tags))
+
+    # From formal spec
+    spec_lower = formal_spec.lower()
+    terms.update(
+        term
+        for term, patterns in AXIOM_SPEC_TERM_PATTERNS.items()
+        if any(p in spec_lower for p in patterns)
+    )
+
+    return frozenset(terms)
+
+
+@lru_cache(maxsize=4096)
+def _axiom_term_mask(formal_spec: str, tags: tuple[str, ...]) -> int:
+    """Bitmask of an axiom's terms that can match error terms."""
+    return _term_mask(_axiom_terms_in(formal_spec, tags))
+
 
 class AxiomLinker:
     """Link axioms to their corresponding error codes."""
@@ -44,12 +159,16 @@ class AxiomLinker:
         self._link_via_patterns(axioms, error_codes)
 
         # Update error codes with linked axioms
+        validated: dict[str, set[str]] = {
+            code: set(ec.validates_axioms) for code, ec in self._error_by_code.items()
+        }
         for axiom in axioms:
             for violation in axiom.violated_by:
                 if violation.code in self._error_by_code:
-                    ec = self._error_by_code[violation.code]
-                    if axiom.id not in ec.validates_axioms:
-                        ec.validates_axioms.append(axiom.id)
+                    seen = validated[violation.code]
+                    if axiom.id not in seen:
+                        seen.add(axiom.id)
+                        self._error_by_code[violation.code].validates_axioms.append(axiom.id)
 
         return AxiomCollection(
             axioms=axioms,
@@ -64,33 +183,52 @@ class AxiomLinker:
         Error rules have the same module and similar conditions as axioms,
         but include an error marker.
         """
-        # Group axioms by module
-        axioms_by_module: dict[str, list[Axiom]] = {}
+        # Group axioms by module, each with its predicates and the set of
+        # codes it already violates
+        axioms_by_module: dict[str, list[tuple[Axiom, frozenset[str], set[str]]]] = (
+            defaultdict(list)
+        )
         for axiom in axioms:
-            module = axiom.source.module
-            if module not in axioms_by_module:
-                axioms_by_module[module] = []
-            axioms_by_module[module].append(axiom)
-
-        # For each error rule, find matching axioms
+            axioms_by_module[axiom.source.module].append(
+                (
+                    axiom,
+                    self._extract_predicates(axiom.formal_spec),
+                    {v.code for v in axiom.violated_by},
+                )
+            )
+
+        # Group linkable error rules by module: rules with an error marker and
+        # at least one known predicate, in a module that has axioms. Each is
+        # flattened to (code, error_type, message, predicates) so matching
+        # reads tuple fields instead of chained attributes.
+        rules_by_module: dict[str, list[tuple[str, str, str, frozenset[str]]]] = (
+            defaultdict(list)
+        )
         for error_rule in error_rules:
-            if not hasattr(error_rule, "error_marker") or not error_rule.error_marker:
+            marker = getattr(error_rule, "error_marker", None)
+            if not marker:
                 continue
-
             module = error_rule.module
             if module not in axioms_by_module:
                 continue
-
-            # Find axioms that the error rule might violate
-            for axiom in axioms_by_module[module]:
-                if self._rules_are_related(axiom, error_rule):
-                    violation = ViolationRef(
-                        code=error_rule.error_marker.code,
-                        error_type=error_rule.error_marker.error_type,
-                        message=error_rule.error_marker.message,
-                    )
-                    if not any(v.code == violation.code for v in axiom.violated_by):
-                        axiom.violated_by.append(violation)
+            error_preds = self._extract_predicates(getattr(error_rule, "requires", None))
+            if error_preds:
+                rules_by_module[module].append(
+                    (marker.code, marker.error_type, marker.message, error_preds)
+                )
+
+        # Within each module, find the axioms each error rule might violate
+        for module, module_rules in rules_by_module.items():
+            module_axioms = axioms_by_module[module]
+            for code, error_type, message, error_preds in module_rules:
+                for axiom, axiom_preds, violated_codes in module_axioms:
+                    if code not in violated_codes and self._predicates_are_related(
+                        axiom_preds, error_preds
+                    ):
+                        axiom.violated_by.append(
+                            ViolationRef(code=code, error_type=error_type, message=message)
+                        )
+                        violated_codes.add(code)
 
     def _rules_are_related(self, axiom: Axiom, error_rule) -> bool:
         """Check if an axiom and error rule are related.
@@ -101,50 +239,29 @@ class AxiomLinker:
         if not hasattr(error_rule, "requires") or not error_rule.requires:
             return False
 
-        # Extract key predicates from both
-        axiom_preds = self._extract_predicates(axiom.formal_spec)
-        error_preds = self._extract_predicates(error_rule.requires)
-
-        # Check for overlapping predicates
-        common = axiom_preds & error_preds
-        if len(common) >= 2:  # At least 2 common predicates
-            return True
+        return self._predicates_are_related(
+            self._extract_predicates(axiom.formal_spec),
+            self._extract_predicates(error_rule.requires),
+        )
 
-        # Check for negation relationship
-        for pred in axiom_preds:
-            negated = f"notBool {pred}"
-            if negated in error_preds or pred.replace("notBool ", "") in error_preds:
-                return True
+    def _predicates_are_related(
+        self, axiom_preds: frozenset[str], error_preds: frozenset[str]
+    ) -> bool:
+        """Check if an axiom's and an error rule's predicates are related.
 
-        return False
+        Predicates are bare names without a notBool prefix, so an axiom
+        requiring ``notBool isZero(V)`` and an error rule on ``isZero(V)``
+        share ``isZero``. Any common predicate therefore covers both the
+        overlap and the negation relationship.
+        """
+        return not axiom_preds.isdisjoint(error_preds)
 
-    def _extract_predicates(self, spec: str) -> set[str]:
+    def _extract_predicates(self, spec: str | None) -> frozenset[str]:
         """Extract key predicates from a K specification."""
         if not spec:
-            return set()
-
-        predicates = set()
-
-        # Common predicate patterns
-        patterns = [
-            "isPromoted",
-            "isZero",
-            "isUnknown",
-            "==Type",
-            "=/=Type",
-            "isPointer",
-            "isInteger",
-            "hasIntegerType",
-            "isFloat",
-            "isComplete",
-            "isConst",
-        ]
-
-        for pattern in patterns:
-            if pattern in spec:
-                predicates.add(pattern)
-
-        return predicates
+            return frozenset()
+
+        return _predicates_in(spec)
 
     def _link_via_patterns(
         self, axioms: list[Axiom], error_codes: list[ErrorCode]
@@ -153,87 +270,47 @@ class AxiomLinker:
 
         This is a fallback when we don't have parsed error rules.
         """
-        # Create a mapping of key terms to error codes
-        term_to_errors: dict[str, list[ErrorCode]] = {}
-
-        for ec in error_codes:
-            terms = self._extract_error_terms(ec.description)
-            for term in terms:
-                if term not in term_to_errors:
-                    term_to_errors[term] = []
-                term_to_errors[term].append(ec)
+        # One term bitmask per error code, so each axiom is compared with
+        # every error in a single vectorized pass
+        error_masks = np.fromiter(
+            (_error_term_mask(ec.description) for ec in error_codes),
+            dtype=np.uint64,
+            count=len(error_codes),
+        )
 
         # Match axioms to errors based on shared terms
         for axiom in axioms:
-            axiom_terms = self._extract_axiom_terms(axiom)
-
-            for term in axiom_terms:
-                if term in term_to_errors:
-                    for ec in term_to_errors[term]:
-                        # Only link if not already linked
-                        if not any(v.code == ec.internal_code for v in axiom.violated_by):
-                            # Check for stronger match
-                            if self._is_strong_match(axiom, ec):
-                                violation = ViolationRef(
-                                    code=ec.internal_code,
-                                    error_type=ec.type.value.upper().replace("_", ""),
-                                    message=ec.description,
-                                )
-                                axiom.violated_by.append(violation)
-
-    def _extract_error_terms(self, description: str) -> set[str]:
-        """Extract key terms from error description."""
-        terms = set()
-        desc_lower = description.lower()
-
-        term_mappings = {
-            "division": ["division", "divide", "/"],
-            "modulus": ["modulus", "modulo", "%", "remainder"],
-            "overflow": ["overflow"],
-            "zero": ["zero", "0"],
-            "pointer": ["pointer"],
-            "integer": ["integer", "int"],
-            "float": ["float", "floating"],
-            "type": ["type"],
-            "conversion": ["conversion", "convert"],
-            "shift": ["shift", "<<", ">>"],
-        }
-
-        for term, patterns in term_mappings.items():
-            if any(p in desc_lower for p in patterns):
-                terms.add(term)
+            violated_codes = {v.code for v in axiom.violated_by}
+
+            # Strong match (as in _is_strong_match): at least 2 common terms,
+            # i.e. the shared mask still has a bit set after clearing its lowest
+            axiom_mask = np.uint64(_axiom_term_mask(axiom.formal_spec, tuple(axiom.tags)))
+            shared = error_masks & axiom_mask
+            for i in np.flatnonzero(shared & (shared - np.uint64(1))).tolist():
+                ec = error_codes[i]
+                # Only link if not already linked
+                if ec.internal_code not in violated_codes:
+                    violation = ViolationRef(
+                        code=ec.internal_code,
+                        error_type=ec.type.value.upper().replace("_", ""),
+                        message=ec.description,
+                    )
+                    axiom.violated_by.append(violation)
+                    violated_codes.add(ec.internal_code)
 
-        return terms
+    def _extract_error_terms(self, description: str) -> frozenset[str]:
+        """Extract key terms from error description."""
+        return _error_terms_in(description)
 
-    def _extract_axiom_terms(self, axiom: Axiom) -> set[str]:
+    def _extract_axiom_terms(self, axiom: Axiom) -> frozenset[str]:
         """Extract key terms from axiom."""
-        terms = set()
-
-        # From tags
-        terms.update(axiom.tags)
-
-        # From formal spec
-        spec_lower = axiom.formal_spec.lower()
-
-        if "zero" in spec_lower or "iszero" in spec_lower:
-            terms.add("zero")
-        if "pointer" in spec_lower:
-            terms.add("pointer")
-        if "integer" in spec_lower or "int" in spec_lower:
-            terms.add("integer")
-        if "float" in spec_lower:
-            terms.add("float")
-        if "type" in spec_lower:
-            terms.add("type")
-
-        return terms
+        return _axiom_terms_in(axiom.formal_spec, tuple(axiom.tags))
 
     def _is_strong_match(self, axiom: Axiom, error: ErrorCode) -> bool:
         """Check if axiom and error have a strong semantic match."""
-        # Get terms from both
-        axiom_terms = self._extract_axiom_terms(axiom)
-        error_terms = self._extract_error_terms(error.description)
+        # Terms from both, as bitmasks over the error-term vocabulary
+        axiom_mask = _axiom_term_mask(axiom.formal_spec, tuple(axiom.tags))
+        error_mask = _error_term_mask(error.description)
 
         # Require at least 2 common terms for a strong match
-        common = axiom_terms & error_terms
-        return len(common) >= 2
+        return (axiom_mask & error_mask).bit_count() >= 2
@@ -22,14 +22,17 @@ from collections import defaultdict
 from axiom.models import Axiom
 
 # Foundation layers that library axioms can depend on
-FOUNDATION_LAYERS = [
+FOUNDATION_LAYERS = frozenset({
     "c11_core",
     "c11_stdlib",
     "cpp_core",
     "cpp_stdlib",
     "cpp20_language",
     "cpp20_stdlib",
-]
+})
+
+# Axiom ID prefixes that identify foundation layer dependencies
+FOUNDATION_ID_PREFIXES = ("c11_", "cpp_", "cpp20_")
 
 # System prompt for the LLM linking task
 LINKING_SYSTEM_PROMPT = """You are an expert at analyzing C++ code semantics.
@@ -46,6 +49,44 @@ Output ONLY valid JSON in this format:
 {"axiom_id_1": ["foundation_id_1", "foundation_id_2"], "axiom_id_2": [...]}
 """
 
+# Fenced JSON block, and a bare JSON object (one level of nesting), in LLM output
+JSON_BLOCK_PATTERN = re.compile(r"```(?:json)?\s*\n?({.*?})\s*\n?```", re.DOTALL)
+JSON_OBJECT_PATTERN = re.compile(r"\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}")
+
+# Foundation concept queries and the content keywords that trigger them.
+# Keywords match as substrings of the lowercased axiom content.
+CONCEPT_QUERIES: dict[str, tuple[str, ...]] = {
+    "lambda expression capture closure": ("lambda",),
+    "template parameter instantiation": ("template", "parameter"),
+    "reference capture lifetime": ("reference", "capture"),
+    "range-based for loop iterator": ("range", "iterator", "loop"),
+}
+
+_KEYWORD_TO_CONCEPT: dict[str, str] = {
+    keyword: query for query, keywords in CONCEPT_QUERIES.items() for keyword in keywords
+}
+
+# All concept keywords in one alternation so content is scanned once
+_CONCEPT_KEYWORD_PATTERN = re.compile(
+    "|".join(re.escape(k) for k in sorted(_KEYWORD_TO_CONCEPT, key=len, reverse=True))
+)
+
+
+def build_concept_queries(content: str) -> list[str]:
+    """Build foundation concept queries for keywords found in content.
+
+    Args:
+        content: Axiom content text to scan.
+
+    Returns:
+        Concept queries in CONCEPT_QUERIES order, one per matched concept.
+    """
+    matched = {
+        _KEYWORD_TO_CONCEPT[m.group(0)]
+        for m in _CONCEPT_KEYWORD_PATTERN.finditer(content.lower())
+    }
+    return [query for query in CONCEPT_QUERIES if query in matched]
+
 
 def group_by_function(axioms: list[Axiom]) -> dict[str, list[Axiom]]:
     """Group axioms by function name for batched processing.
@@ -68,6 +109,48 @@ def group_by_function(axioms: list[Axiom]) -> dict[str, list[Axiom]]:
     return dict(groups)
 
 
+def has_foundation_dependency(axiom: Axiom) -> bool:
+    """Check whether an axiom already depends on a foundation axiom.
+
+    Args:
+        axiom: Axiom to check.
+
+    Returns:
+        True if any depends_on ID contains a foundation layer prefix.
+    """
+    return any(
+        prefix in dep for dep in axiom.depends_on for prefix in FOUNDATION_ID_PREFIXES
+    )
+
+
+def partition_for_linking(
+    axioms: list[Axiom],
+    include_linked: bool = False,
+) -> tuple[dict[str, list[Axiom]], int]:
+    """Group axioms by function and count existing foundation links in one pass.
+
+    Args:
+        axioms: List of axioms to partition.
+        include_linked: If True, axioms that already have foundation
+            dependencies are grouped too (re-link everything).
+
+    Returns:
+        Tuple of (groups, linked_count). Groups map function name to the
+        axioms to link, as in group_by_function. linked_count is the
+        number of axioms that already have foundation dependencies.
+    """
+    groups: dict[str, list[Axiom]] = defaultdict(list)
+    linked_count = 0
+    for axiom in axioms:
+        if has_foundation_dependency(axiom):
+            linked_count += 1
+            if not include_linked:
+                continue
+        groups[axiom.function or "ungrouped"].append(axiom)
+
+    return dict(groups), linked_count
+
+
 def filter_to_foundation_layers(search_results: list[dict]) -> list[dict]:
     """Filter search results to only include foundation layer axioms.
 
@@ -84,6 +167,7 @@ def search_foundations(
     query: str,
     lance,
     limit: int = 30,
+    cache: dict[tuple[str, int], list[dict]] | None = None,
 ) -> list[dict]:
     """Search for foundation axioms, excluding library layer.
 
@@ -95,16 +179,26 @@ def search_foundations(
         query: Search query text.
         lance: LanceDB loader instance.
         limit: Maximum foundation axioms to return.
+        cache: Optional dict of previous results keyed by (query, limit).
+            Empty results are cached too, so queries with no foundation
+            hits are not searched again.
 
     Returns:
         List of foundation layer axiom dicts.
     """
+    key = (query, limit)
+    if cache is not None and key in cache:
+        return cache[key]
+
     # Fetch more results to account for library axioms being filtered out
     # Library axioms often dominate similarity results
     raw_limit = limit * 10
     results = lance.search(query, limit=raw_limit)
-    filtered = filter_to_foundation_layers(results)
-    return filtered[:limit]
+    filtered = filter_to_foundation_layers(results)[:limit]
+
+    if cache is not None:
+        cache[key] = filtered
+    return filtered
 
 
 def merge_depends_on(
@@ -118,12 +212,10 @@ def merge_depends_on(
         new_links: New links to add.
 
     Returns:
-        Merged list with duplicates removed.
+        Merged list with duplicates removed, existing links first,
+        in first-seen order.
     """
-    existing_set = set(existing or [])
-    new_set = set(new_links)
-    merged = existing_set | new_set
-    return list(merged)
+    return list(dict.fromkeys([*(existing or []), *new_links]))
 
 
 def parse_llm_response(response: str) -> dict[str, list[str]]:
@@ -145,12 +237,12 @@ def parse_llm_response(response: str) -> dict[str, list[str]]:
         return {}
 
     # Try to extract JSON from markdown code blocks first
-    code_block_match = re.search(r"```(?:json)?\s*\n?({.*?})\s*\n?```", response, re.DOTALL)
+    code_block_match = JSON_BLOCK_PATTERN.search(response) if "```" in response else None
     if code_block_match:
         json_str = code_block_match.group(1)
     else:
         # Try to find JSON object in the response
-        json_match = re.search(r"\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}", response)
+        json_match = JSON_OBJECT_PATTERN.search(response)
         if json_match:
             json_str = json_match.group(0)
         else:
@@ -12,7 +12,10 @@ by combining tree-sitter parsing with LLM analysis and RAG-based foundation axio
 import hashlib
 import re
 import sys
+import tomllib
+from collections.abc import Callable
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
 import toml
@@ -30,6 +33,44 @@ from .prompts import (
 )
 from .subgraph_builder import SubgraphBuilder
 
+# Fenced ```toml block in an LLM response
+TOML_BLOCK_PATTERN = re.compile(r"```toml\s*(.*?)\s*```", re.DOTALL)
+
+
+@lru_cache(maxsize=256)
+def _loads_toml(toml_text: str) -> dict | None:
+    """Parse TOML text, returning None if it is not valid TOML.
+
+    Uses the stdlib tomllib parser, falling back to the more lenient
+    toml package for responses tomllib rejects. Results are memoized by
+    text, so re-parsing an identical LLM response is free; callers must
+    treat the returned dict as read-only.
+    """
+    try:
+        return tomllib.loads(toml_text)
+    except tomllib.TOMLDecodeError:
+        pass
+
+    try:
+        return toml.loads(toml_text)
+    except toml.TomlDecodeError:
+        return None
+
+
+def _cached_system_prompt(system_prompt: str) -> list[dict]:
+    """Build an Anthropic system block marked for prompt caching.
+
+    The system prompt is identical for every function in a run, so caching
+    it lets later requests skip reprocessing the shared prefix.
+    """
+    return [
+        {
+            "type": "text",
+            "text": system_prompt,
+            "cache_control": {"type": "ephemeral"},
+        }
+    ]
+
 
 @dataclass
 class ExtractionResult:
@@ -92,6 +133,12 @@ class AxiomExtractor:
         self.subgraph_builder = SubgraphBuilder(language=language)
         self.language = language
 
+        # RAG results keyed by normalized query text, reused across functions
+        self._rag_cache: dict[str, list[dict]] = {}
+
+        # LLM responses keyed by exact prompt text
+        self._response_cache: dict[str, str] = {}
+
     def extract_from_source(
         self,
         source_code: str,
@@ -140,7 +187,7 @@ class AxiomExtractor:
         )
 
         # Step 5: Call LLM
-        raw_response = self._call_llm(prompt)
+        raw_response = self._cached_llm_call(self._call_llm, prompt)
         result.raw_response = raw_response
 
         if raw_response:
@@ -270,7 +317,7 @@ class AxiomExtractor:
         )
 
         # Call LLM
-        raw_response = self._call_macro_llm(prompt)
+        raw_response = self._cached_llm_call(self._call_macro_llm, prompt)
         result.raw_response = raw_response
 
         if raw_response:
@@ -348,19 +395,7 @@ class AxiomExtractor:
             return []
 
         queries = build_macro_search_queries(macro)
-
-        seen_ids = set()
-        results = []
-
-        for query in queries:
-            search_results = self.vector_db.search(query, limit=5)
-            for result in search_results:
-                axiom_id = result.get("id")
-                if axiom_id and axiom_id not in seen_ids:
-                    seen_ids.add(axiom_id)
-                    results.append(result)
-
-        return results
+        return self._search_queries(queries)
 
     def _call_macro_llm(self, prompt: str) -> str:
         """Call the LLM with the macro extraction prompt.
@@ -383,7 +418,7 @@ class AxiomExtractor:
             response = self.llm_client.messages.create(
                 model="claude-sonnet-4-20250514",
                 max_tokens=4096,
-                system=MACRO_SYSTEM_PROMPT,
+                system=_cached_system_prompt(MACRO_SYSTEM_PROMPT),
                 messages=[{"role": "user", "content": prompt}],
             )
             if response.content:
@@ -439,14 +474,39 @@ class AxiomExtractor:
 
         # Generate search queries based on operations
         queries = build_search_queries(subgraph)
+        return self._search_queries(queries)
+
+    def _search_queries(self, queries: list[str]) -> list[dict]:
+        """Run RAG queries and collect unique results.
+
+        Results are cached per normalized query for the lifetime of the
+        extractor, so queries shared between functions (e.g. the division or
+        null pointer queries) hit the vector DB once. Uncached queries are
+        embedded in a single batch via search_batch.
+
+        Args:
+            queries: Search query strings
+
+        Returns:
+            List of unique axiom dicts, in query order
+        """
+        # Normalize and dedupe, keeping the first spelling of each query
+        pending: dict[str, str] = {}
+        for query in queries:
+            pending.setdefault(query.strip().lower(), query)
+
+        missing = [key for key in pending if key not in self._rag_cache]
+        if missing:
+            texts = [pending[key] for key in missing]
+            batch = self.vector_db.search_batch(texts, limit=5)
+            self._rag_cache.update(zip(missing, batch, strict=True))
 
         # Collect unique results
         seen_ids = set()
         results = []
 
-        for query in queries:
-            search_results = self.vector_db.search(query, limit=5)
-            for result in search_results:
+        for key in pending:
+            for result in self._rag_cache[key]:
                 axiom_id = result.get("id")
                 if axiom_id and axiom_id not in seen_ids:
                     seen_ids.add(axiom_id)
@@ -454,6 +514,29 @@ class AxiomExtractor:
 
         return results
 
+    def _cached_llm_call(self, call: Callable[[str], str], prompt: str) -> str:
+        """Call an LLM method, reusing the response for an identical prompt.
+
+        Only exact prompt matches are reused: near-identical prompts can
+        describe different functions, and their axioms must not be shared.
+        Empty responses (errors, timeouts) are not cached.
+
+        Args:
+            call: Bound LLM method, e.g. self._call_llm
+            prompt: The formatted extraction prompt
+
+        Returns:
+            Raw LLM response text
+        """
+        cached = self._response_cache.get(prompt)
+        if cached is not None:
+            return cached
+
+        response = call(prompt)
+        if response:
+            self._response_cache[prompt] = response
+        return response
+
     def _call_llm(self, prompt: str) -> str:
         """Call the LLM with the extraction prompt.
 
@@ -477,7 +560,7 @@ class AxiomExtractor:
             response = self.llm_client.messages.create(
                 model="claude-sonnet-4-20250514",
                 max_tokens=4096,
-                system=SYSTEM_PROMPT,
+                system=_cached_system_prompt(SYSTEM_PROMPT),
                 messages=[{"role": "user", "content": prompt}],
             )
             if response.content:
@@ -570,16 +653,15 @@ class AxiomExtractor:
         axioms = []
 
         # Extract TOML block from response
-        toml_match = re.search(r"```toml\s*(.*?)\s*```", response, re.DOTALL)
+        toml_match = TOML_BLOCK_PATTERN.search(response) if "```" in response else None
         if toml_match:
             toml_text = toml_match.group(1)
         else:
             # Try parsing the whole response as TOML
             toml_text = response
 
-        try:
-            data = toml.loads(toml_text)
-        except toml.TomlDecodeError:
+        data = _loads_toml(toml_text)
+        if data is None:
             # Could not parse TOML
             return axioms
 
@@ -277,16 +277,15 @@ def format_related_axioms(axiom_results: list) -> str:
     if not axiom_results:
         return "No related foundation axioms found."
 
-    sections = []
-    for result in axiom_results:
-        sections.append(RELATED_AXIOM_TEMPLATE.format(
+    return "\n".join(
+        RELATED_AXIOM_TEMPLATE.format(
             axiom_id=result.get("id", "unknown"),
             content=result.get("content", ""),
             formal_spec=result.get("formal_spec", "N/A"),
             standard_refs=result.get("c_standard_refs", []),
-        ))
-
-    return "\n".join(sections)
+        )
+        for result in axiom_results
+    )
 
 
 def build_extraction_prompt(
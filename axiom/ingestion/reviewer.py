@@ -427,7 +427,11 @@ class ReviewSessionManager:
 
     @staticmethod
     def _dict_to_axiom(data: dict) -> Axiom:
-        """Convert a dict back to an Axiom."""
+        """Convert a dict back to an Axiom.
+
+        The dict was written by _axiom_to_dict from an already-validated
+        Axiom, so it is rebuilt with model_construct to skip re-validation.
+        """
         from axiom.models import AxiomType, SourceLocation
 
         axiom_type = None
@@ -437,12 +441,12 @@ class ReviewSessionManager:
             except ValueError:
                 pass
 
-        return Axiom(
+        return Axiom.model_construct(
             id=data["id"],
             content=data["content"],
             formal_spec=data["formal_spec"],
             layer=data["layer"],
-            source=SourceLocation(
+            source=SourceLocation.model_construct(
                 file=data.get("source_file", ""),
                 module=data.get("source_module", ""),
             ),
@@ -6,11 +6,12 @@
 """Pydantic models for axioms and error codes."""
 
 import tomllib
+from collections import defaultdict
 from datetime import UTC, datetime
 from enum import Enum
 from pathlib import Path
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 def _utc_now() -> datetime:
@@ -31,6 +32,8 @@ class ErrorType(str, Enum):
 class SourceLocation(BaseModel):
     """Location of an axiom in K semantic files."""
 
+    model_config = ConfigDict(frozen=True)
+
     file: str
     module: str
     line_start: int | None = None
@@ -40,6 +43,8 @@ class SourceLocation(BaseModel):
 class ViolationRef(BaseModel):
     """Reference to an error that occurs when an axiom is violated."""
 
+    model_config = ConfigDict(frozen=True)
+
     code: str  # e.g., "CEMX1"
     error_type: str  # UNDEF, CV, IMPL, etc.
     message: str
@@ -90,6 +95,14 @@ class Axiom(BaseModel):
     pairing_required: bool = False  # True if pairing is mandatory
     pairing_source: str = ""  # "k_semantics", "spec", "comment_annotation", etc.
 
+    def __hash__(self) -> int:
+        """Hash by ID so axioms can be used in sets and as dict keys.
+
+        Equality still compares all fields; axioms that compare equal share
+        an ID, so hashing the ID alone is consistent with it.
+        """
+        return hash(self.id)
+
     @property
     def effective_confidence(self) -> float:
         """Calculate effective confidence based on review status.
@@ -141,6 +154,22 @@ class AxiomCollection(BaseModel):
     axioms: list[Axiom] = Field(default_factory=list)
     error_codes: list[ErrorCode] = Field(default_factory=list)
 
+    def group_by_type(self) -> dict[AxiomType | None, list[Axiom]]:
+        """Bucket axioms by axiom_type in a single pass.
+
+        Callers filtering on several types should index once with this
+        rather than scanning axioms per type. Not cached, since axioms may
+        be added or retyped after construction.
+
+        Returns:
+            Dict mapping axiom type (None if untyped) to axioms, in
+            collection order.
+        """
+        groups: dict[AxiomType | None, list[Axiom]] = defaultdict(list)
+        for axiom in self.axioms:
+            groups[axiom.axiom_type].append(axiom)
+        return dict(groups)
+
     def to_toml(self) -> str:
         """Serialize collection to TOML string."""
 
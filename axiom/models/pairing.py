@@ -12,7 +12,7 @@ lock/unlock). Idioms represent common usage patterns showing correct composition
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class Pairing:
     """A pairing between two functions that must be used together.
 
@@ -41,7 +41,7 @@ class Pairing:
     evidence: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Idiom:
     """A usage idiom showing how multiple functions compose correctly.
 
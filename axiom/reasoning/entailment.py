@@ -68,6 +68,10 @@ class EntailmentClassifier:
         "violat",  # matches "violation", "violated", "violates"
     ]
 
+    # Lowercased once so polarity checks don't re-lower per call
+    _POSITIVE_INDICATORS_LOWER = tuple(i.lower() for i in POSITIVE_INDICATORS)
+    _NEGATIVE_INDICATORS_LOWER = tuple(i.lower() for i in NEGATIVE_INDICATORS)
+
     # Topic patterns for detecting what the text is about
     TOPIC_PATTERNS = {
         "overflow": [
@@ -234,14 +238,12 @@ class EntailmentClassifier:
         # should take precedence over positive indicators)
         # e.g., "Operation requires: pointer is valid" should be negative
         # even though it contains "is valid"
-        for indicator in self.NEGATIVE_INDICATORS:
-            if indicator.lower() in text_lower:
-                return "negative"
+        if any(i in text_lower for i in self._NEGATIVE_INDICATORS_LOWER):
+            return "negative"
 
         # Check for positive indicators
-        for indicator in self.POSITIVE_INDICATORS:
-            if indicator.lower() in text_lower:
-                return "positive"
+        if any(i in text_lower for i in self._POSITIVE_INDICATORS_LOWER):
+            return "positive"
 
         return "neutral"
 
@@ -10,6 +10,9 @@ from dataclasses import dataclass, field
 from .contradiction import Contradiction, ContradictionDetector
 from .proof_chain import ProofChain, ProofChainGenerator, ProofStep
 
+# Claim keywords that indicate security-sensitive operations
+DANGEROUS_KEYWORDS = frozenset({"overflow", "buffer", "pointer", "null", "bounds"})
+
 
 @dataclass
 class ValidationResult:
@@ -226,21 +229,23 @@ class AxiomValidator:
         """Generate warnings based on validation results."""
         warnings = []
 
+        contents_lower = [c.axiom_content.lower() for c in contradictions]
+
         # Warn about undefined behavior
-        if any("undefined" in c.axiom_content.lower() for c in contradictions):
+        if any("undefined" in content for content in contents_lower):
             warnings.append(
                 "WARNING: This claim may involve undefined behavior in C/C++."
             )
 
         # Warn about implementation-defined behavior
-        if any("implementation" in c.axiom_content.lower() for c in contradictions):
+        if any("implementation" in content for content in contents_lower):
             warnings.append(
                 "WARNING: This may depend on implementation-defined behavior."
             )
 
         # Warn about security implications
-        dangerous_keywords = ["overflow", "buffer", "pointer", "null", "bounds"]
-        if any(kw in claim.lower() for kw in dangerous_keywords):
+        claim_lower = claim.lower()
+        if any(kw in claim_lower for kw in DANGEROUS_KEYWORDS):
             warnings.append(
                 "WARNING: This claim involves security-sensitive operations."
             )
@@ -198,6 +198,33 @@ class LanceDBLoader:
         results = table.search(query_vector).limit(limit).to_list()
         return results
 
+    def search_batch(
+        self,
+        queries: list[str],
+        table_name: str = "axioms",
+        limit: int = 10,
+    ) -> list[list[dict]]:
+        """Search for several queries, embedding them in a single batch.
+
+        Args:
+            queries: Search query texts.
+            table_name: Name of the LanceDB table.
+            limit: Maximum number of results per query.
+
+        Returns:
+            One list of matching axiom records per query, in query order.
+        """
+        if not queries or table_name not in self.db.table_names():
+            return [[] for _ in queries]
+
+        table = self.db.open_table(table_name)
+        query_vectors = self.model.encode(queries)
+
+        return [
+            table.search(vector.tolist()).limit(limit).to_list()
+            for vector in query_vectors
+        ]
+
     def search_by_tag(
         self,
         tag: str,
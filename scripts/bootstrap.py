@@ -88,6 +88,20 @@ def main() -> int:
         action="store_true",
         help="Extract with dependency resolution (two-pass)",
     )
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Parse K files in N processes (default: 1)",
+    )
+    parser.add_argument(
+        "--parse-cache",
+        type=Path,
+        default=None,
+        metavar="DIR",
+        help="Cache parsed K files in DIR across runs (e.g. ~/.cache/axiom/kparse)",
+    )
 
     args = parser.parse_args()
 
@@ -171,7 +185,9 @@ def main() -> int:
         combined_index: dict[str, list[str]] = {}
         for idx_dir in index_dirs:
             if idx_dir.exists():
-                extractor = KDependencyExtractor(idx_dir)
+                extractor = KDependencyExtractor(
+                    idx_dir, max_workers=args.parallel, cache_dir=args.parse_cache
+                )
                 dir_index = extractor.get_function_index()
                 for func, axiom_ids in dir_index.items():
                     if func in combined_index:
@@ -183,15 +199,17 @@ def main() -> int:
         # Now extract ONLY from semantics_dirs with dependency resolution
         for semantics_dir in semantics_dirs:
             print(f"  - Scanning {semantics_dir.name}/...")
-            extractor = KDependencyExtractor(semantics_dir)
+            extractor = KDependencyExtractor(
+                semantics_dir, max_workers=args.parallel, cache_dir=args.parse_cache
+            )
             axioms = extractor.extract_with_dependencies(base_index=combined_index)
             all_axioms.extend(axioms)
             print(f"    Found {len(axioms)} axioms")
     else:
         for semantics_dir in semantics_dirs:
             print(f"  - Scanning {semantics_dir.name}/...")
-            extractor = KSemanticsExtractor(semantics_dir)
-            axioms = extractor.extract_all()
+            extractor = KSemanticsExtractor(semantics_dir, cache_dir=args.parse_cache)
+            axioms = extractor.extract_all(max_workers=args.parallel)
             all_axioms.extend(axioms)
             print(f"    Found {len(axioms)} axioms")
 
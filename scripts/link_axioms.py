@@ -27,8 +27,15 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from axiom.extractors.semantic_linker import FOUNDATION_LAYERS
 from axiom.vectors import LanceDBLoader
 
+# Words marking a source axiom as a requirement on something else
+REQUIRES_WORDS = ("requires", "must be", "must have", "needs", "access to")
+
+# Words marking a candidate axiom as providing/defining something
+PROVIDER_WORDS = ("provides", "defines", "creates", "introduces", "declares", "establishes")
+
 # Keywords that indicate dependencies between axioms
 DEPENDENCY_PATTERNS = [
     # Variable/symbol dependencies
@@ -76,11 +83,17 @@ def find_foundation_axioms(
     # Use dict to track best match for each axiom ID
     candidates_by_id: dict[str, dict] = {}
 
+    # The same results recur across keywords and queries, so lowercase each
+    # content string and check it for provider words only once
+    content_info: dict[str, tuple[str, bool]] = {}
+
     # Determine if source axiom is a "requires" type
     source_lower = source_content.lower()
-    is_requires = any(w in source_lower for w in ["requires", "must be", "must have", "needs", "access to"])
+    is_requires = any(w in source_lower for w in REQUIRES_WORDS)
 
     for keyword in keywords:
+        keyword_lower = keyword.lower()
+
         # Search strategies: direct keyword search first, then semantic variations
         search_queries = [
             keyword,  # Direct search for the keyword
@@ -99,24 +112,20 @@ def find_foundation_axioms(
                     continue
 
                 content = r.get("content", "")
-                content_lower = content.lower()
+                if content not in content_info:
+                    lowered = content.lower()
+                    content_info[content] = (
+                        lowered,
+                        any(word in lowered for word in PROVIDER_WORDS),
+                    )
+                content_lower, is_provider = content_info[content]
 
                 # Check if this axiom is from a foundation layer
                 layer = r.get("layer", "")
-                is_foundation = layer in {
-                    "c11_core", "c11_stdlib",
-                    "cpp_core", "cpp_stdlib",
-                    "cpp20_language", "cpp20_stdlib",
-                }
-
-                # Check if content mentions providing/defining something
-                is_provider = any(word in content_lower for word in [
-                    "provides", "defines", "creates", "introduces",
-                    "declares", "establishes",
-                ])
+                is_foundation = layer in FOUNDATION_LAYERS
 
                 # Check if keyword appears in this axiom's content
-                keyword_in_content = keyword.lower() in content_lower
+                keyword_in_content = keyword_lower in content_lower
 
                 # For "requires X" axioms, prefer "provides X" axioms
                 complements_source = is_requires and is_provider
@@ -20,9 +20,11 @@ Usage:
     python scripts/link_semantic.py ilp_for_axioms.toml
     python scripts/link_semantic.py ilp_for_axioms.toml --dry-run
     python scripts/link_semantic.py ilp_for_axioms.toml --force
+    python scripts/link_semantic.py ilp_for_axioms.toml --parallel 4
 """
 
 import argparse
+import concurrent.futures
 import subprocess
 import sys
 from pathlib import Path
@@ -32,10 +34,12 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from axiom.extractors.semantic_linker import (
     LINKING_SYSTEM_PROMPT,
+    build_concept_queries,
     build_linking_prompt,
-    group_by_function,
+    has_foundation_dependency,
     merge_depends_on,
     parse_llm_response,
+    partition_for_linking,
     search_foundations,
     validate_candidate_ids,
 )
@@ -48,6 +52,7 @@ def get_candidate_foundations(
     axioms: list,
     lance: LanceDBLoader,
     limit: int = 30,
+    search_cache: dict | None = None,
 ) -> list[dict]:
     """Use semantic search to find candidate foundation axioms.
 
@@ -61,53 +66,40 @@ def get_candidate_foundations(
         axioms: Library axioms to find candidates for.
         lance: LanceDB loader instance.
         limit: Maximum candidates to return.
+        search_cache: Optional search_foundations cache shared across groups.
 
     Returns:
         List of candidate foundation axiom dicts.
     """
-    all_candidates = []
-    seen_ids = set()
+    # Dict preserves first-seen order and dedupes by ID
+    candidates: dict[str, dict] = {}
+
+    def add_results(query: str, search_limit: int) -> bool:
+        """Add new search results; return True once the limit is reached."""
+        for r in search_foundations(query, lance, limit=search_limit, cache=search_cache):
+            candidates.setdefault(r["id"], r)
+            if len(candidates) >= limit:
+                return True
+        return False
 
     # Strategy 1: Search by signature (most specific C++ terms)
     for axiom in axioms[:3]:
-        if axiom.signature:
-            results = search_foundations(axiom.signature, lance, limit=10)
-            for r in results:
-                if r["id"] not in seen_ids:
-                    all_candidates.append(r)
-                    seen_ids.add(r["id"])
+        if axiom.signature and add_results(axiom.signature, 10):
+            return list(candidates.values())
 
     # Strategy 2: Search by content with C++ keywords added
     content = " ".join(a.content for a in axioms[:3])
     # Add generic C++ terms to improve matching
     cpp_terms = "C++ lambda template parameter reference capture"
-    query = f"{content} {cpp_terms}"
-    results = search_foundations(query, lance, limit=20)
-    for r in results:
-        if r["id"] not in seen_ids:
-            all_candidates.append(r)
-            seen_ids.add(r["id"])
+    if add_results(f"{content} {cpp_terms}", 20):
+        return list(candidates.values())
 
     # Strategy 3: Search for key C++ concepts mentioned in content
-    key_concepts = []
-    content_lower = content.lower()
-    if "lambda" in content_lower:
-        key_concepts.append("lambda expression capture closure")
-    if "template" in content_lower or "parameter" in content_lower:
-        key_concepts.append("template parameter instantiation")
-    if "reference" in content_lower or "capture" in content_lower:
-        key_concepts.append("reference capture lifetime")
-    if "range" in content_lower or "iterator" in content_lower or "loop" in content_lower:
-        key_concepts.append("range-based for loop iterator")
-
-    for concept in key_concepts:
-        results = search_foundations(concept, lance, limit=10)
-        for r in results:
-            if r["id"] not in seen_ids:
-                all_candidates.append(r)
-                seen_ids.add(r["id"])
-
-    return all_candidates[:limit]
+    for concept in build_concept_queries(content):
+        if add_results(concept, 10):
+            break
+
+    return list(candidates.values())
 
 
 def link_function_group(
@@ -199,6 +191,13 @@ def main() -> int:
         default=None,
         help="Limit number of function groups to process (for testing)",
     )
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Link N function groups in parallel (default: 1)",
+    )
 
     args = parser.parse_args()
 
@@ -212,21 +211,12 @@ def main() -> int:
     total = len(collection.axioms)
     print(f"  Loaded {total} axioms")
 
-    # Count current foundation dependencies
-    foundation_deps = 0
-    for a in collection.axioms:
-        if a.depends_on:
-            for dep in a.depends_on:
-                # Check if any deps are from foundation layers
-                if any(layer in dep for layer in ["c11_", "cpp_", "cpp20_"]):
-                    foundation_deps += 1
-                    break
-
-    print(f"  With foundation deps: {foundation_deps}/{total}")
-
-    # Group by function
+    # Count existing foundation links and group the rest by function in one pass
     print("\nGrouping axioms by function...")
-    groups = group_by_function(collection.axioms)
+    groups, foundation_deps = partition_for_linking(collection.axioms, include_linked=args.force)
+    print(f"  With foundation deps: {foundation_deps}/{total}")
+    if not args.force:
+        print(f"  Skipping {foundation_deps} already-linked axioms (use --force to re-link)")
     print(f"  Found {len(groups)} function groups")
 
     # Show group sizes
@@ -252,31 +242,46 @@ def main() -> int:
     if args.limit:
         group_items = group_items[:args.limit]
 
+    # Find candidate foundations for each group via semantic search.
+    # Concept queries repeat across groups, so results are shared.
+    search_cache: dict = {}
+    work: list[tuple[str, list, list[dict]]] = []
     for func_name, func_axioms in group_items:
         groups_processed += 1
         print(f"\n  [{groups_processed}/{len(group_items)}] {func_name} ({len(func_axioms)} axioms)")
 
-        # Get candidate foundations via semantic search
-        candidates = get_candidate_foundations(func_name, func_axioms, lance)
+        candidates = get_candidate_foundations(
+            func_name, func_axioms, lance, search_cache=search_cache
+        )
         print(f"    Found {len(candidates)} candidate foundations")
 
         if not candidates:
             print("    Skipping - no candidates found")
             continue
 
-        # Call LLM to identify direct dependencies
-        links = link_function_group(func_name, func_axioms, candidates, dry_run=args.dry_run)
-
-        if args.dry_run:
-            continue
-
-        # Merge links into axioms
-        for axiom in func_axioms:
-            new_links = links.get(axiom.id, [])
-            if new_links:
-                axiom.depends_on = merge_depends_on(axiom.depends_on, new_links)
-                total_linked += 1
-                print(f"    Linked {axiom.id}: +{len(new_links)} deps")
+        work.append((func_name, func_axioms, candidates))
+
+    # Call LLM to identify direct dependencies (I/O bound, so groups can overlap)
+    def link_group(item: tuple[str, list, list[dict]]) -> dict[str, list[str]]:
+        func_name, func_axioms, candidates = item
+        return link_function_group(func_name, func_axioms, candidates, dry_run=args.dry_run)
+
+    if args.parallel > 1:
+        print(f"\nLinking {len(work)} groups with {args.parallel} workers...")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=args.parallel) as executor:
+            group_links = list(executor.map(link_group, work))
+    else:
+        group_links = [link_group(item) for item in work]
+
+    # Merge links into axioms, in group order
+    if not args.dry_run:
+        for (_, func_axioms, _), links in zip(work, group_links, strict=True):
+            for axiom in func_axioms:
+                new_links = links.get(axiom.id, [])
+                if new_links:
+                    axiom.depends_on = merge_depends_on(axiom.depends_on, new_links)
+                    total_linked += 1
+                    print(f"    Linked {axiom.id}: +{len(new_links)} deps")
 
     if args.dry_run:
         print(f"\n[DRY RUN] Would process {len(group_items)} groups")
@@ -287,13 +292,7 @@ def main() -> int:
     collection.save_toml(args.toml_file)
 
     # Report final stats
-    foundation_deps = 0
-    for a in collection.axioms:
-        if a.depends_on:
-            for dep in a.depends_on:
-                if any(layer in dep for layer in ["c11_", "cpp_", "cpp20_"]):
-                    foundation_deps += 1
-                    break
+    foundation_deps = sum(1 for a in collection.axioms if has_foundation_dependency(a))
 
     print(f"\nFinal: {foundation_deps}/{total} axioms with foundation deps")
     print(f"Total axioms updated: {total_linked}")
@@ -106,19 +106,14 @@ def modify_axiom(axiom: Axiom) -> Axiom:
         except ValueError:
             print(f"  Invalid confidence '{new_conf}', keeping original")
 
-    return Axiom(
-        id=axiom.id,
-        content=content,
-        formal_spec=formal_spec,
-        layer=axiom.layer,
-        source=axiom.source,
-        function=axiom.function,
-        header=axiom.header,
-        axiom_type=axiom_type,
-        on_violation=on_violation,
-        confidence=confidence,
-        c_standard_refs=axiom.c_standard_refs,
-        tags=axiom.tags,
+    return axiom.model_copy(
+        update={
+            "content": content,
+            "formal_spec": formal_spec,
+            "axiom_type": axiom_type,
+            "on_violation": on_violation,
+            "confidence": confidence,
+        }
     )
 
 
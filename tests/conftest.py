@@ -4,26 +4,48 @@ from pathlib import Path
 
 import pytest
 
+from axiom.extractors.error_codes import ErrorCodesParser
+from axiom.extractors.k_semantics import KSemanticsExtractor, ParsedRule
+from axiom.models import ErrorCode
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def c_semantics_root() -> Path:
     """Path to the c-semantics submodule."""
     return Path(__file__).parent.parent / "external" / "c-semantics"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def error_codes_csv(c_semantics_root: Path) -> Path:
     """Path to the Error_Codes.csv file."""
     return c_semantics_root / "examples" / "c" / "error-codes" / "Error_Codes.csv"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def parsed_error_codes(error_codes_csv: Path) -> list[ErrorCode]:
+    """Error codes parsed once per session. Treat as read-only."""
+    return ErrorCodesParser(error_codes_csv).parse()
+
+
+@pytest.fixture(scope="session")
 def multiplicative_k(c_semantics_root: Path) -> Path:
     """Path to the multiplicative.k file (good test case)."""
     return c_semantics_root / "semantics" / "c" / "language" / "common" / "expr" / "multiplicative.k"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def multiplicative_rules(multiplicative_k: Path) -> list[ParsedRule]:
+    """Rules parsed once from multiplicative.k, shared by read-only tests."""
+    return KSemanticsExtractor(multiplicative_k.parent).parse_file(multiplicative_k)
+
+
+@pytest.fixture(scope="session")
 def stdlib_k(c_semantics_root: Path) -> Path:
     """Path to the stdlib.k file (has \\fromStandard comments)."""
     return c_semantics_root / "semantics" / "c" / "library" / "stdlib.k"
+
+
+@pytest.fixture(scope="session")
+def stdlib_rules(stdlib_k: Path) -> list[ParsedRule]:
+    """Rules parsed once from stdlib.k, shared by read-only tests."""
+    return KSemanticsExtractor(stdlib_k.parent).parse_file(stdlib_k)
@@ -5,53 +5,88 @@
 
 """Tests for comment annotation extraction from source files."""
 
-import tempfile
 from pathlib import Path
 
+import pytest
+
+from axiom.extractors.comment_annotations import (
+    extract_pairings_from_comments,
+    extract_pairings_from_source,
+    scan_directory_for_annotations,
+)
+
+# Annotated sources shared by the table-driven tests
+SINGLE_LINE_PAIRING_SOURCE = "// @axiom:pairs_with mutex_unlock\nvoid mutex_lock(Mutex* m);\n"
+BLOCK_COMMENT_PAIRING_SOURCE = (
+    "/* @axiom:pairs_with resource_release */\nvoid resource_acquire(Resource* r);\n"
+)
+REQUIRED_TRUE_SOURCE = (
+    "// @axiom:pairs_with mutex_unlock\n"
+    "// @axiom:role opener\n"
+    "// @axiom:required true\n"
+    "void mutex_lock(Mutex* m);\n"
+)
+REQUIRED_FALSE_SOURCE = (
+    "// @axiom:pairs_with cleanup_optional\n"
+    "// @axiom:required false\n"
+    "void init_with_cleanup(void);\n"
+)
+
+
+@pytest.fixture
+def make_header(tmp_path: Path):
+    """Factory fixture writing source text to a file under tmp_path."""
+    counter = 0
+
+    def _make(source: str, suffix: str = ".h") -> Path:
+        nonlocal counter
+        counter += 1
+        path = tmp_path / f"case_{counter}{suffix}"
+        path.write_text(source)
+        return path
+
+    return _make
+
 
 class TestPairsWithAnnotation:
     """Tests for @axiom:pairs_with comment extraction."""
 
-    def test_single_line_pairs_with(self) -> None:
-        """@axiom:pairs_with in single-line comment extracts pairing."""
-        from axiom.extractors.comment_annotations import extract_pairings_from_comments
-
-        source = """\
-// @axiom:pairs_with mutex_unlock
-void mutex_lock(Mutex* m);
-"""
-        with tempfile.NamedTemporaryFile(suffix=".h", mode="w", delete=False) as f:
-            f.write(source)
-            f.flush()
-            pairings, idioms = extract_pairings_from_comments(Path(f.name))
+    @pytest.mark.parametrize(
+        ("source", "opener", "closer"),
+        [
+            (SINGLE_LINE_PAIRING_SOURCE, "mutex_lock", "mutex_unlock"),
+            (BLOCK_COMMENT_PAIRING_SOURCE, "resource_acquire", "resource_release"),
+        ],
+        ids=["single_line", "block_comment"],
+    )
+    def test_pairs_with_extracts_pairing(
+        self, make_header, source: str, opener: str, closer: str
+    ) -> None:
+        """@axiom:pairs_with in single-line and block comments extracts pairing."""
+        pairings, _ = extract_pairings_from_comments(make_header(source))
 
         assert len(pairings) == 1
-        assert "mutex_lock" in pairings[0].opener_id
-        assert "mutex_unlock" in pairings[0].closer_id
+        assert opener in pairings[0].opener_id
+        assert closer in pairings[0].closer_id
         assert pairings[0].source == "comment_annotation"
 
-    def test_multiple_annotations_on_function(self) -> None:
-        """Multiple @axiom: annotations on a function are all extracted."""
-        from axiom.extractors.comment_annotations import extract_pairings_from_comments
-
-        source = """\
-// @axiom:pairs_with mutex_unlock
-// @axiom:role opener
-// @axiom:required true
-void mutex_lock(Mutex* m);
-"""
-        with tempfile.NamedTemporaryFile(suffix=".h", mode="w", delete=False) as f:
-            f.write(source)
-            f.flush()
-            pairings, _ = extract_pairings_from_comments(Path(f.name))
+    @pytest.mark.parametrize(
+        ("source", "required"),
+        [
+            (REQUIRED_TRUE_SOURCE, True),
+            (REQUIRED_FALSE_SOURCE, False),
+        ],
+        ids=["required_true", "required_false"],
+    )
+    def test_required_annotation(self, make_header, source: str, required: bool) -> None:
+        """@axiom:required is read alongside the other annotations on a function."""
+        pairings, _ = extract_pairings_from_comments(make_header(source))
 
         assert len(pairings) == 1
-        assert pairings[0].required is True
+        assert pairings[0].required is required
 
-    def test_bidirectional_pairing(self) -> None:
+    def test_bidirectional_pairing(self, make_header) -> None:
         """Both opener and closer annotations create pairing."""
-        from axiom.extractors.comment_annotations import extract_pairings_from_comments
-
         source = """\
 // @axiom:pairs_with mutex_unlock
 // @axiom:role opener
@@ -61,165 +96,208 @@ void mutex_lock(Mutex* m);
 // @axiom:role closer
 void mutex_unlock(Mutex* m);
 """
-        with tempfile.NamedTemporaryFile(suffix=".h", mode="w", delete=False) as f:
-            f.write(source)
-            f.flush()
-            pairings, _ = extract_pairings_from_comments(Path(f.name))
+        pairings, _ = extract_pairings_from_comments(make_header(source))
 
         assert len(pairings) == 2
 
-    def test_block_comment_annotation(self) -> None:
-        """@axiom: in block comments is also extracted."""
-        from axiom.extractors.comment_annotations import extract_pairings_from_comments
 
-        source = """\
-/* @axiom:pairs_with resource_release */
-void resource_acquire(Resource* r);
-"""
-        with tempfile.NamedTemporaryFile(suffix=".h", mode="w", delete=False) as f:
-            f.write(source)
-            f.flush()
-            pairings, _ = extract_pairings_from_comments(Path(f.name))
+class TestExtractFromSource:
+    """Tests for extracting annotations from in-memory source text."""
 
-        assert len(pairings) == 1
-        assert "resource_acquire" in pairings[0].opener_id
-        assert "resource_release" in pairings[0].closer_id
+    def test_matches_file_extraction(self, make_header) -> None:
+        """Source text and file extraction produce the same results."""
+        path = make_header(SINGLE_LINE_PAIRING_SOURCE)
 
-    def test_required_false(self) -> None:
-        """@axiom:required false creates optional pairing."""
-        from axiom.extractors.comment_annotations import extract_pairings_from_comments
+        from_file = extract_pairings_from_comments(path)
+        from_source = extract_pairings_from_source(SINGLE_LINE_PAIRING_SOURCE, path.name)
 
-        source = """\
-// @axiom:pairs_with cleanup_optional
-// @axiom:required false
-void init_with_cleanup(void);
-"""
-        with tempfile.NamedTemporaryFile(suffix=".h", mode="w", delete=False) as f:
-            f.write(source)
-            f.flush()
-            pairings, _ = extract_pairings_from_comments(Path(f.name))
+        assert from_source == from_file
+
+    def test_source_name_in_evidence(self) -> None:
+        """The source name is recorded as pairing evidence."""
+        source = "// @axiom:pairs_with free\nvoid* malloc(size_t n);\n"
+
+        pairings, _ = extract_pairings_from_source(source, "stdlib.h")
 
         assert len(pairings) == 1
-        assert pairings[0].required is False
+        assert pairings[0].evidence == "@axiom:pairs_with in stdlib.h"
+
+    def test_repeated_parse_returns_fresh_objects(self) -> None:
+        """Memoized parsing still returns independent results per call."""
+        source = (
+            "// @axiom:idiom scoped_lock\n"
+            "// @axiom:template lock(${m}); { ${body} } unlock(${m});\n"
+            "void lock(Mutex* m);\n"
+        )
+
+        _, first = extract_pairings_from_source(source)
+        first[0].participants.append("axiom_for_unlock")
+        _, second = extract_pairings_from_source(source)
+
+        assert second[0].participants == ["axiom_for_lock"]
+
+    def test_memo_is_bounded_and_keyed_by_digest(self) -> None:
+        """The memo keeps small digests, not source text, and evicts old entries."""
+        from axiom.extractors.comment_annotations import (
+            _ANNOTATED_FUNCTIONS_CACHE,
+            _ANNOTATED_FUNCTIONS_CACHE_SIZE,
+        )
+
+        _ANNOTATED_FUNCTIONS_CACHE.clear()
+        for i in range(_ANNOTATED_FUNCTIONS_CACHE_SIZE + 10):
+            extract_pairings_from_source(f"// @axiom:pairs_with close_{i}\nvoid open_{i}(int x);\n")
+
+        assert len(_ANNOTATED_FUNCTIONS_CACHE) == _ANNOTATED_FUNCTIONS_CACHE_SIZE
+        assert all(len(key) == 16 for key in _ANNOTATED_FUNCTIONS_CACHE)
+
+    def test_memo_is_safe_across_threads(self) -> None:
+        """Concurrent parses that keep evicting each other still return every pairing."""
+        import concurrent.futures
+
+        from axiom.extractors.comment_annotations import _ANNOTATED_FUNCTIONS_CACHE_SIZE
+
+        sources = [
+            f"// @axiom:pairs_with close_{i % (_ANNOTATED_FUNCTIONS_CACHE_SIZE * 2)}\n"
+            f"void open_{i % (_ANNOTATED_FUNCTIONS_CACHE_SIZE * 2)}(int x);\n"
+            for i in range(_ANNOTATED_FUNCTIONS_CACHE_SIZE * 20)
+        ]
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(extract_pairings_from_source, sources))
+
+        assert all(len(pairings) == 1 for pairings, _ in results)
 
 
 class TestIdiomAnnotation:
     """Tests for @axiom:idiom and @axiom:template comment extraction."""
 
-    def test_idiom_with_template(self) -> None:
+    def test_idiom_with_template(self, make_header) -> None:
         """@axiom:idiom and @axiom:template create idiom."""
-        from axiom.extractors.comment_annotations import extract_pairings_from_comments
-
         source = """\
 // @axiom:idiom scoped_lock
 // @axiom:template mutex_lock(${m}); { ${body} } mutex_unlock(${m});
 void mutex_lock(Mutex* m);
 """
-        with tempfile.NamedTemporaryFile(suffix=".h", mode="w", delete=False) as f:
-            f.write(source)
-            f.flush()
-            _, idioms = extract_pairings_from_comments(Path(f.name))
+        _, idioms = extract_pairings_from_comments(make_header(source))
 
         assert len(idioms) == 1
         assert idioms[0].name == "scoped_lock"
         assert "${body}" in idioms[0].template
         assert "mutex_lock" in idioms[0].template
 
-    def test_idiom_without_template_ignored(self) -> None:
+    def test_idiom_without_template_ignored(self, make_header) -> None:
         """@axiom:idiom without @axiom:template is ignored."""
-        from axiom.extractors.comment_annotations import extract_pairings_from_comments
-
         source = """\
 // @axiom:idiom incomplete_idiom
 void some_function(void);
 """
-        with tempfile.NamedTemporaryFile(suffix=".h", mode="w", delete=False) as f:
-            f.write(source)
-            f.flush()
-            _, idioms = extract_pairings_from_comments(Path(f.name))
+        _, idioms = extract_pairings_from_comments(make_header(source))
 
         # Should not create an idiom without template
         assert len(idioms) == 0
 
 
+@pytest.fixture(scope="class")
+def scan_tree(tmp_path_factory) -> Path:
+    """Source tree shared by the read-only directory scan tests.
+
+    Layout:
+        lib.h, lib.hpp, lib.c, lib.hxx   one annotated function each
+        src/utils/mutex.h                nested annotated header
+        empty/                           no source files
+    """
+    root = tmp_path_factory.mktemp("scan_tree")
+    (root / "lib.h").write_text("// @axiom:pairs_with unlock\nvoid lock(void);\n")
+    (root / "lib.hpp").write_text("// @axiom:pairs_with close\nvoid open(void);\n")
+    (root / "lib.c").write_text("// @axiom:pairs_with end\nvoid begin(void);\n")
+    (root / "lib.hxx").write_text("// @axiom:pairs_with detach\nvoid attach(void);\n")
+
+    subdir = root / "src" / "utils"
+    subdir.mkdir(parents=True)
+    (subdir / "mutex.h").write_text(
+        "// @axiom:pairs_with mutex_unlock\nvoid mutex_lock(void);\n"
+    )
+
+    (root / "empty").mkdir()
+    return root
+
+
 class TestDirectoryScan:
     """Tests for scan_directory_for_annotations."""
 
-    def test_scan_finds_all_header_files(self) -> None:
-        """scan_directory_for_annotations finds .h and .hpp files."""
-        from axiom.extractors.comment_annotations import scan_directory_for_annotations
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmppath = Path(tmpdir)
-
-            # Create header file with annotation
-            (tmppath / "lib.h").write_text("""\
-// @axiom:pairs_with unlock
-void lock(void);
-""")
-            # Create cpp header file with annotation
-            (tmppath / "lib.hpp").write_text("""\
-// @axiom:pairs_with close
-void open(void);
-""")
-            # Create source file with annotation
-            (tmppath / "lib.c").write_text("""\
-// @axiom:pairs_with end
-void begin(void);
-""")
-
-            pairings, _ = scan_directory_for_annotations(tmppath)
-
-        assert len(pairings) == 3
-
-    def test_scan_recursive(self) -> None:
+    def test_scan_finds_all_header_files(self, scan_tree: Path) -> None:
+        """scan_directory_for_annotations finds .h, .hpp and .c files."""
+        pairings, _ = scan_directory_for_annotations(scan_tree, extensions=[".h", ".hpp", ".c"])
+
+        assert sorted(p.opener_id for p in pairings) == [
+            "axiom_for_begin",
+            "axiom_for_lock",
+            "axiom_for_mutex_lock",
+            "axiom_for_open",
+        ]
+
+    def test_scan_recursive(self, scan_tree: Path) -> None:
         """scan_directory_for_annotations searches subdirectories."""
-        from axiom.extractors.comment_annotations import scan_directory_for_annotations
+        pairings, _ = scan_directory_for_annotations(scan_tree / "src")
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmppath = Path(tmpdir)
+        assert len(pairings) == 1
+        assert pairings[0].opener_id == "axiom_for_mutex_lock"
 
-            # Create nested directory
-            subdir = tmppath / "src" / "utils"
-            subdir.mkdir(parents=True)
+    def test_scan_default_extensions_cover_tree(self, scan_tree: Path) -> None:
+        """Every annotated file in the tree is scanned exactly once."""
+        pairings, _ = scan_directory_for_annotations(scan_tree)
 
-            (subdir / "mutex.h").write_text("""\
-// @axiom:pairs_with mutex_unlock
-void mutex_lock(void);
-""")
+        assert len(pairings) == 5
 
-            pairings, _ = scan_directory_for_annotations(tmppath)
+    def test_scan_parallel_matches_sequential(self, scan_tree: Path) -> None:
+        """Scanning with several workers gives the same results in the same order."""
+        sequential, _ = scan_directory_for_annotations(scan_tree)
+        parallel, _ = scan_directory_for_annotations(scan_tree, max_workers=4)
 
-        assert len(pairings) == 1
+        assert parallel == sequential
 
-    def test_scan_with_custom_extensions(self) -> None:
+    def test_scan_with_custom_extensions(self, scan_tree: Path) -> None:
         """scan_directory_for_annotations respects extensions parameter."""
-        from axiom.extractors.comment_annotations import scan_directory_for_annotations
+        # Only scan .hxx files
+        pairings, _ = scan_directory_for_annotations(scan_tree, extensions=[".hxx"])
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmppath = Path(tmpdir)
+        assert len(pairings) == 1
+        assert "attach" in pairings[0].opener_id
 
-            (tmppath / "lib.h").write_text("""\
-// @axiom:pairs_with unlock
-void lock(void);
-""")
-            (tmppath / "lib.hxx").write_text("""\
-// @axiom:pairs_with close
-void open(void);
-""")
+    def test_scan_skips_empty_and_unannotated_files(self, tmp_path: Path) -> None:
+        """Empty files and files without @axiom: markers yield nothing."""
+        (tmp_path / "empty.h").write_text("")
+        (tmp_path / "plain.h").write_text("void plain(void);\n")
 
-            # Only scan .hxx files
-            pairings, _ = scan_directory_for_annotations(tmppath, extensions=[".hxx"])
+        pairings, idioms = scan_directory_for_annotations(tmp_path)
 
-        assert len(pairings) == 1
-        assert "open" in pairings[0].opener_id
+        assert pairings == []
+        assert idioms == []
 
-    def test_scan_empty_directory(self) -> None:
-        """scan_directory_for_annotations handles empty directory."""
-        from axiom.extractors.comment_annotations import scan_directory_for_annotations
+    def test_scan_skips_undecodable_files(self, tmp_path: Path) -> None:
+        """A file that is not valid text is skipped without hiding the others."""
+        (tmp_path / "binary.h").write_bytes(b"\xff\xfe// @axiom:pairs_with b\nvoid a(int x);\n")
+        (tmp_path / "lock.h").write_text("// @axiom:pairs_with unlock\nvoid lock(int m);\n")
+
+        pairings, _ = scan_directory_for_annotations(tmp_path, max_workers=2)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            pairings, idioms = scan_directory_for_annotations(Path(tmpdir))
+        assert [p.opener_id for p in pairings] == ["axiom_for_lock"]
+
+    def test_mmap_prefilter_for_large_files(self, tmp_path: Path, monkeypatch) -> None:
+        """Files above the size threshold are pre-filtered with mmap."""
+        from axiom.extractors import comment_annotations
+
+        monkeypatch.setattr(comment_annotations, "MMAP_PREFILTER_MIN_SIZE", 1)
+        (tmp_path / "plain.h").write_text("void plain(void);\n")
+        (tmp_path / "lock.h").write_text("// @axiom:pairs_with unlock\nvoid lock(int m);\n")
+
+        pairings, _ = scan_directory_for_annotations(tmp_path)
+
+        assert [p.opener_id for p in pairings] == ["axiom_for_lock"]
+
+    def test_scan_empty_directory(self, scan_tree: Path) -> None:
+        """scan_directory_for_annotations handles empty directory."""
+        pairings, idioms = scan_directory_for_annotations(scan_tree / "empty")
 
         assert len(pairings) == 0
         assert len(idioms) == 0
@@ -228,68 +306,83 @@ void open(void);
 class TestEdgeCases:
     """Edge case tests for comment annotation extraction."""
 
-    def test_no_annotations(self) -> None:
-        """Files without @axiom: annotations return empty lists."""
-        from axiom.extractors.comment_annotations import extract_pairings_from_comments
+    @pytest.mark.parametrize(
+        "source",
+        [
+            "// Regular comment\n"
+            "void some_function(void);\n"
+            "\n"
+            "/* Another comment */\n"
+            "int another_function(int x);\n",
+            "// @axiom:pairs_with something\n"
+            "// This is just a standalone comment, not a function\n"
+            "\n"
+            "// A completely separate section with no function\n"
+            "struct SomeStruct {\n"
+            "    int x;\n"
+            "};\n",
+        ],
+        ids=["no_annotations", "annotation_not_followed_by_function"],
+    )
+    def test_extracts_nothing(self, make_header, source: str) -> None:
+        """Files without annotations, or annotations with no following function, yield nothing."""
+        pairings, idioms = extract_pairings_from_comments(make_header(source))
+
+        assert len(pairings) == 0
+        assert len(idioms) == 0
 
+    def test_mixed_comment_styles(self, make_header) -> None:
+        """Plain block comments don't swallow later // annotations."""
         source = """\
-// Regular comment
-void some_function(void);
+/* License header */
+// @axiom:pairs_with mutex_unlock
+void mutex_lock(Mutex* m);
 
-/* Another comment */
-int another_function(int x);
+/* @axiom:pairs_with resource_release */
+void resource_acquire(Resource* r);
 """
-        with tempfile.NamedTemporaryFile(suffix=".h", mode="w", delete=False) as f:
-            f.write(source)
-            f.flush()
-            pairings, idioms = extract_pairings_from_comments(Path(f.name))
+        pairings, _ = extract_pairings_from_comments(make_header(source))
 
-        assert len(pairings) == 0
-        assert len(idioms) == 0
-
-    def test_annotation_not_followed_by_function(self) -> None:
-        """@axiom: not followed by function declaration is ignored."""
-        from axiom.extractors.comment_annotations import extract_pairings_from_comments
+        assert [p.opener_id for p in pairings] == [
+            "axiom_for_mutex_lock",
+            "axiom_for_resource_acquire",
+        ]
 
+    def test_mixed_comment_styles_in_source_order(self, make_header) -> None:
+        """Results follow source order, not all // blocks before /* */ blocks."""
         source = """\
-// @axiom:pairs_with something
-// This is just a standalone comment, not a function
+/* @axiom:pairs_with resource_release */
+void resource_acquire(Resource* r);
 
-// A completely separate section with no function
-struct SomeStruct {
-    int x;
-};
+// @axiom:pairs_with mutex_unlock
+void mutex_lock(Mutex* m);
+
+/* @axiom:pairs_with file_close */
+void file_open(File* f);
 """
-        with tempfile.NamedTemporaryFile(suffix=".h", mode="w", delete=False) as f:
-            f.write(source)
-            f.flush()
-            pairings, _ = extract_pairings_from_comments(Path(f.name))
+        pairings, _ = extract_pairings_from_comments(make_header(source))
 
-        # Should not match annotation that's not followed by function
-        assert len(pairings) == 0
+        assert [p.opener_id for p in pairings] == [
+            "axiom_for_resource_acquire",
+            "axiom_for_mutex_lock",
+            "axiom_for_file_open",
+        ]
 
-    def test_macro_function_style(self) -> None:
+    def test_macro_function_style(self, make_header) -> None:
         """Annotations work with macro-style function declarations."""
-        from axiom.extractors.comment_annotations import extract_pairings_from_comments
-
         source = """\
 // @axiom:pairs_with ILP_END
 #define ILP_FOR(type, var, start, end, N) \\
     for (type var = start; var < end; var += N)
 """
-        with tempfile.NamedTemporaryFile(suffix=".h", mode="w", delete=False) as f:
-            f.write(source)
-            f.flush()
-            pairings, _ = extract_pairings_from_comments(Path(f.name))
+        pairings, _ = extract_pairings_from_comments(make_header(source))
 
         # May or may not work with macros - document behavior
         # For now, we accept either 0 or 1 pairings for macros
         assert len(pairings) <= 1
 
-    def test_cpp_class_methods(self) -> None:
+    def test_cpp_class_methods(self, make_header) -> None:
         """Annotations work with C++ class method declarations."""
-        from axiom.extractors.comment_annotations import extract_pairings_from_comments
-
         source = """\
 class Mutex {
 public:
@@ -300,9 +393,34 @@ public:
     void unlock();
 };
 """
-        with tempfile.NamedTemporaryFile(suffix=".hpp", mode="w", delete=False) as f:
-            f.write(source)
-            f.flush()
-            pairings, _ = extract_pairings_from_comments(Path(f.name))
+        pairings, _ = extract_pairings_from_comments(make_header(source, suffix=".hpp"))
 
         assert len(pairings) >= 1
+
+
+class TestBenchmark:
+    """Parse-cost guardrail, run only when pytest-benchmark is installed."""
+
+    def test_bench_extract_large_header(self, tmp_path: Path, request) -> None:
+        """Extracting a large annotated header stays a single linear pass."""
+        pytest.importorskip("pytest_benchmark")
+        from axiom.extractors.comment_annotations import _ANNOTATED_FUNCTIONS_CACHE
+
+        benchmark = request.getfixturevalue("benchmark")
+        header = tmp_path / "big.h"
+        header.write_text(
+            "".join(
+                f"// @axiom:pairs_with release_{i}\nvoid acquire_{i}(int x);\n"
+                for i in range(5000)
+            )
+        )
+
+        # Clear the memo before each round so the parse itself is measured
+        pairings, _ = benchmark.pedantic(
+            extract_pairings_from_comments,
+            args=(header,),
+            setup=_ANNOTATED_FUNCTIONS_CACHE.clear,
+            rounds=10,
+        )
+
+        assert len(pairings) == 5000
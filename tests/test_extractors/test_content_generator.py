@@ -113,6 +113,15 @@ class TestContentGenerator:
         # orBool conditions should be parsed but marked differently
         assert len(conditions) >= 1
 
+    def test_parse_conditions_keeps_orbool_within_andbool_terms(self) -> None:
+        """andBool binds the split; orBool alternatives stay in one condition."""
+        generator = ContentGenerator()
+
+        formal_spec = "isPromoted(T)\n   andBool (isUnknown(V) orBool isTrap(V))"
+        conditions = generator.parse_conditions(formal_spec)
+
+        assert conditions == ["isPromoted(T)", "(isUnknown(V) orBool isTrap(V))"]
+
     def test_generates_axiom_id(self) -> None:
         """Generator should create a unique axiom ID."""
         generator = ContentGenerator()
@@ -130,3 +139,28 @@ class TestContentGenerator:
         assert "_" in axiom_id or axiom_id.isalnum()
         # Should reference the module or operation
         assert "division" in axiom_id or "multiplicative" in axiom_id or "c11" in axiom_id
+
+    def test_generate_is_memoized_across_instances(self) -> None:
+        """Repeated specs are generated once, even from new generator instances."""
+        from axiom.extractors.content_generator import _generate_cached
+
+        formal_spec = "notBool isZero(I2) andBool isPromoted(T)"
+        first = ContentGenerator().generate(formal_spec, operation="modulus")
+        hits = _generate_cached.cache_info().hits
+
+        second = ContentGenerator().generate(formal_spec, operation="modulus")
+
+        assert second == first
+        assert _generate_cached.cache_info().hits == hits + 1
+
+    def test_generate_cache_keyed_on_operation(self) -> None:
+        """The same spec with a different operation is not served from cache."""
+        generator = ContentGenerator()
+        formal_spec = "notBool isZero(I2)"
+
+        assert generator.generate(formal_spec, operation="division").startswith(
+            "Integer division"
+        )
+        assert generator.generate(formal_spec, operation="modulus").startswith(
+            "Modulus operation"
+        )
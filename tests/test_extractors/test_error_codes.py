@@ -9,19 +9,17 @@ from axiom.models import ErrorCode, ErrorType
 class TestErrorCodesParser:
     """Tests for ErrorCodesParser."""
 
-    def test_parse_csv_returns_error_codes(self, error_codes_csv: Path) -> None:
+    def test_parse_csv_returns_error_codes(self, parsed_error_codes: list[ErrorCode]) -> None:
         """Parser should return a list of ErrorCode objects."""
-        parser = ErrorCodesParser(error_codes_csv)
-        error_codes = parser.parse()
+        error_codes = parsed_error_codes
 
         assert isinstance(error_codes, list)
         assert len(error_codes) > 0
         assert all(isinstance(ec, ErrorCode) for ec in error_codes)
 
-    def test_parse_csv_extracts_ub_codes(self, error_codes_csv: Path) -> None:
+    def test_parse_csv_extracts_ub_codes(self, parsed_error_codes: list[ErrorCode]) -> None:
         """Parser should extract undefined behavior codes."""
-        parser = ErrorCodesParser(error_codes_csv)
-        error_codes = parser.parse()
+        error_codes = parsed_error_codes
 
         ub_codes = [ec for ec in error_codes if ec.type == ErrorType.UNDEFINED_BEHAVIOR]
         assert len(ub_codes) > 0
@@ -32,26 +30,23 @@ class TestErrorCodesParser:
         assert cemx1.code == "UB-CEMX1"
         assert "division" in cemx1.description.lower() or "0" in cemx1.description
 
-    def test_parse_csv_extracts_cv_codes(self, error_codes_csv: Path) -> None:
+    def test_parse_csv_extracts_cv_codes(self, parsed_error_codes: list[ErrorCode]) -> None:
         """Parser should extract constraint violation codes."""
-        parser = ErrorCodesParser(error_codes_csv)
-        error_codes = parser.parse()
+        error_codes = parsed_error_codes
 
         cv_codes = [ec for ec in error_codes if ec.type == ErrorType.CONSTRAINT_VIOLATION]
         assert len(cv_codes) > 0
 
-    def test_parse_csv_extracts_impl_codes(self, error_codes_csv: Path) -> None:
+    def test_parse_csv_extracts_impl_codes(self, parsed_error_codes: list[ErrorCode]) -> None:
         """Parser should extract implementation-defined codes."""
-        parser = ErrorCodesParser(error_codes_csv)
-        error_codes = parser.parse()
+        error_codes = parsed_error_codes
 
         impl_codes = [ec for ec in error_codes if ec.type == ErrorType.IMPLEMENTATION_DEFINED]
         assert len(impl_codes) > 0
 
-    def test_parse_csv_extracts_c_standard_refs(self, error_codes_csv: Path) -> None:
+    def test_parse_csv_extracts_c_standard_refs(self, parsed_error_codes: list[ErrorCode]) -> None:
         """Parser should extract C standard references."""
-        parser = ErrorCodesParser(error_codes_csv)
-        error_codes = parser.parse()
+        error_codes = parsed_error_codes
 
         # Find a code with known references
         codes_with_refs = [ec for ec in error_codes if ec.c_standard_refs]
@@ -61,10 +56,9 @@ class TestErrorCodesParser:
         sample = codes_with_refs[0]
         assert all(":" in ref or "." in ref for ref in sample.c_standard_refs)
 
-    def test_parse_csv_handles_internal_code_extraction(self, error_codes_csv: Path) -> None:
+    def test_parse_csv_handles_internal_code_extraction(self, parsed_error_codes: list[ErrorCode]) -> None:
         """Parser should correctly extract internal code from full code."""
-        parser = ErrorCodesParser(error_codes_csv)
-        error_codes = parser.parse()
+        error_codes = parsed_error_codes
 
         for ec in error_codes:
             # Internal code should be the part after the prefix
@@ -72,10 +66,9 @@ class TestErrorCodesParser:
             prefix, internal = ec.code.split("-", 1)
             assert ec.internal_code == internal
 
-    def test_parse_csv_skips_header_rows(self, error_codes_csv: Path) -> None:
+    def test_parse_csv_skips_header_rows(self, parsed_error_codes: list[ErrorCode]) -> None:
         """Parser should skip header/metadata rows in CSV."""
-        parser = ErrorCodesParser(error_codes_csv)
-        error_codes = parser.parse()
+        error_codes = parsed_error_codes
 
         # No error code should have empty or template-like values
         for ec in error_codes:
@@ -83,3 +76,40 @@ class TestErrorCodesParser:
             assert ec.internal_code
             assert not ec.code.startswith(",")
             assert "Error_Type" not in ec.code
+
+
+class TestErrorCodesParserCache:
+    """Tests for reusing CSV reads across parsers."""
+
+    def _write_csv(self, path: Path, description: str) -> None:
+        path.write_text(
+            "Error_Code,Description,C11_Refs,Error_Type\n"
+            f'UB-CEMX1,"{description}","6.5.5:5, J.2:1 item 45",Undefined Behavior\n',
+            encoding="utf-8",
+        )
+
+    def test_repeated_parse_returns_independent_codes(self, tmp_path: Path) -> None:
+        """Each parse builds new ErrorCode objects from the shared rows."""
+        csv_path = tmp_path / "Error_Codes.csv"
+        self._write_csv(csv_path, "Division by 0.")
+
+        first = ErrorCodesParser(csv_path).parse()
+        first[0].validates_axioms.append("some_axiom")
+        second = ErrorCodesParser(csv_path).parse()
+
+        assert second[0].validates_axioms == []
+        assert second[0].c_standard_refs == ["6.5.5:5", "J.2:1 item 45"]
+
+    def test_modified_file_is_reread(self, tmp_path: Path) -> None:
+        """Changing the file's mtime invalidates the cached rows."""
+        import os
+
+        csv_path = tmp_path / "Error_Codes.csv"
+        self._write_csv(csv_path, "Division by 0.")
+        ErrorCodesParser(csv_path).parse()
+
+        self._write_csv(csv_path, "Modulus by 0.")
+        stat = csv_path.stat()
+        os.utime(csv_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert ErrorCodesParser(csv_path).parse()[0].description == "Modulus by 0."
@@ -86,6 +86,17 @@ class TestExtractFunctionCalls:
         # Only K primitive, should be empty or contain only primitives
         assert "tv" not in calls
 
+    def test_function_names_are_interned(self) -> None:
+        """Names from different rules are the same shared string object."""
+        import sys
+
+        first = extract_function_calls("alignedAlloc(Align, Sz)")
+        second = extract_function_calls('builtin("alignedAlloc", Align, Sz)')
+
+        assert first[0] is sys.intern("alignedAlloc")
+        assert "alignedAlloc" in second
+        assert second[second.index("alignedAlloc")] is first[0]
+
 
 class TestBuildFunctionIndex:
     """Tests for building function name to axiom ID index."""
@@ -189,6 +200,16 @@ class TestResolveDependsOn:
         assert "c11_malloc_precond" in deps
         assert "c11_malloc_postcond" in deps
 
+    def test_shared_axiom_ids_deduplicated(self) -> None:
+        """Axiom IDs reachable from several calls appear once, in first-seen order."""
+        calls = ["calloc", "malloc"]
+        index = {
+            "calloc": ["c11_calloc", "c11_alloc"],
+            "malloc": ["c11_alloc", "c11_malloc"],
+        }
+        deps = resolve_depends_on(calls, index)
+        assert deps == ["c11_calloc", "c11_alloc", "c11_malloc"]
+
     def test_empty_calls(self) -> None:
         """Should handle empty calls list."""
         deps = resolve_depends_on([], {"alloc": ["c11_alloc"]})
@@ -250,6 +271,23 @@ class TestKDependencyExtractor:
                 f"Axiom {axiom.id} depends on itself"
             )
 
+    def test_parallel_matches_sequential(self, tmp_path: Path) -> None:
+        """Parsing K files in worker processes gives the same axioms in the same order."""
+        for name in ("MULTIPLICATIVE", "ADDITIVE", "SHIFT"):
+            (tmp_path / f"{name.lower()}.k").write_text(
+                f"module C-COMMON-EXPR-{name}\n"
+                "    rule tv(I1:Int, T::UType) / tv(I2:Int, T'::UType)\n"
+                "        => intArithInterpret(T, I1 /Int I2)\n"
+                "        requires isPromoted(T) andBool notBool isZero(I2)\n"
+                "endmodule\n"
+            )
+
+        sequential = KDependencyExtractor(tmp_path).extract_with_dependencies()
+        parallel = KDependencyExtractor(tmp_path, max_workers=2).extract_with_dependencies()
+
+        assert len(sequential) == 3
+        assert parallel == sequential
+
 
 class TestBuiltinDelegation:
     """Tests for detecting builtin function delegation."""
@@ -274,6 +312,15 @@ class TestBuiltinDelegation:
         calls = extract_function_calls(rhs)
         assert "malloc" in calls
 
+    def test_only_builtin_string_arg_is_a_call(self) -> None:
+        """String arguments of other calls are not treated as function names."""
+        rhs = 'builtin ( "malloc", foo(N)) ~> error("bad size")'
+        calls = extract_function_calls(rhs)
+        assert "malloc" in calls
+        assert "foo" in calls
+        assert "error" in calls
+        assert "bad size" not in calls
+
 
 class TestCrossLayerDependencies:
     """Tests for cross-layer dependency resolution using base_index."""
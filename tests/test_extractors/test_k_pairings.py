@@ -83,13 +83,23 @@ class TestCellPatternExtraction:
 
         assert patterns == []
 
+    def test_repeated_text_returns_fresh_list(self) -> None:
+        """Memoized scanning still returns an independent list per call."""
+        from axiom.extractors.k_pairings import extract_cell_patterns
+
+        rhs = "<malloced> M:Map </malloced>"
+        first = extract_cell_patterns(rhs)
+        first.append(("heap", "write"))
+
+        assert extract_cell_patterns(rhs) == [("malloced", "read")]
+
 
 class TestPairingExtraction:
     """Tests for extracting pairings from K rules."""
 
     def test_extracts_malloc_free_pairing(self) -> None:
         """malloc and free are paired via shared <malloced> cell."""
-        from axiom.extractors.k_pairings import extract_pairings_from_rules
+        from axiom.extractors.k_pairings import extract_pairings_from_rules, index_pairings
 
         rules = [
             ParsedRule(
@@ -118,10 +128,7 @@ class TestPairingExtraction:
 
         assert len(pairings) >= 1
         # malloc (writer) should be paired with free (remover)
-        malloc_free = next(
-            (p for p in pairings if "malloc" in p.opener_id and "free" in p.closer_id),
-            None,
-        )
+        malloc_free = index_pairings(pairings).get(("axiom_for_malloc", "axiom_for_free"))
         assert malloc_free is not None
         assert malloc_free.cell == "malloced"
         assert malloc_free.source == "k_semantics"
@@ -170,6 +177,22 @@ class TestPairingExtraction:
         realloc_pairings = [p for p in pairings if "realloc" in p.opener_id or "realloc" in p.closer_id]
         assert len(realloc_pairings) >= 1
 
+    def test_index_pairings_by_ids(self) -> None:
+        """index_pairings maps (opener_id, closer_id) to the first matching pairing."""
+        from axiom.extractors.k_pairings import index_pairings
+        from axiom.models.pairing import Pairing
+
+        first = Pairing("axiom_for_lock", "axiom_for_unlock", True, "k_semantics", 1.0)
+        duplicate = Pairing("axiom_for_lock", "axiom_for_unlock", True, "naming_heuristic", 0.7)
+        other = Pairing("axiom_for_open", "axiom_for_close", True, "naming_heuristic", 0.7)
+
+        index = index_pairings([first, duplicate, other])
+
+        assert index == {
+            ("axiom_for_lock", "axiom_for_unlock"): first,
+            ("axiom_for_open", "axiom_for_close"): other,
+        }
+
     def test_ignores_rules_without_cell_access(self) -> None:
         """Rules without cell access don't generate pairings."""
         from axiom.extractors.k_pairings import extract_pairings_from_rules
@@ -328,6 +351,18 @@ class TestNamingHeuristics:
         )
         assert create_destroy is not None
 
+    def test_init_pairs_with_every_known_closer(self) -> None:
+        """An X_init opener pairs with each X_<closer> present, in convention order."""
+        from axiom.extractors.k_pairings import detect_naming_pairings
+
+        functions = ["ctx_finish", "ctx_init", "ctx_destroy", "create_ctx_init"]
+        pairings = detect_naming_pairings(functions)
+
+        assert [(p.opener_id, p.closer_id) for p in pairings] == [
+            ("axiom_for_ctx_init", "axiom_for_ctx_destroy"),
+            ("axiom_for_ctx_init", "axiom_for_ctx_finish"),
+        ]
+
     def test_no_false_positives(self) -> None:
         """Don't create pairings for unrelated functions."""
         from axiom.extractors.k_pairings import detect_naming_pairings
@@ -2,6 +2,8 @@
 
 from pathlib import Path
 
+import pytest
+
 from axiom.extractors.k_semantics import KSemanticsExtractor, ParsedRule
 from axiom.models import Axiom
 
@@ -18,19 +20,17 @@ class TestKSemanticsExtractor:
         assert len(rules) > 0
         assert all(isinstance(r, ParsedRule) for r in rules)
 
-    def test_extractor_finds_module_name(self, multiplicative_k: Path) -> None:
+    def test_extractor_finds_module_name(self, multiplicative_rules: list[ParsedRule]) -> None:
         """Extractor should identify the module name."""
-        extractor = KSemanticsExtractor(multiplicative_k.parent.parent.parent.parent)
-        rules = extractor.parse_file(multiplicative_k)
+        rules = multiplicative_rules
 
         # All rules from this file should have the same module
         modules = {r.module for r in rules}
         assert "C-COMMON-EXPR-MULTIPLICATIVE" in modules
 
-    def test_extractor_finds_requires_clauses(self, multiplicative_k: Path) -> None:
+    def test_extractor_finds_requires_clauses(self, multiplicative_rules: list[ParsedRule]) -> None:
         """Extractor should extract requires clauses from rules."""
-        extractor = KSemanticsExtractor(multiplicative_k.parent.parent.parent.parent)
-        rules = extractor.parse_file(multiplicative_k)
+        rules = multiplicative_rules
 
         rules_with_requires = [r for r in rules if r.requires]
         assert len(rules_with_requires) > 0
@@ -40,10 +40,9 @@ class TestKSemanticsExtractor:
         assert any("isPromoted" in req for req in requires_texts)
         assert any("isZero" in req for req in requires_texts)
 
-    def test_extractor_identifies_error_markers(self, multiplicative_k: Path) -> None:
+    def test_extractor_identifies_error_markers(self, multiplicative_rules: list[ParsedRule]) -> None:
         """Extractor should identify UNDEF/CV/IMPL error markers."""
-        extractor = KSemanticsExtractor(multiplicative_k.parent.parent.parent.parent)
-        rules = extractor.parse_file(multiplicative_k)
+        rules = multiplicative_rules
 
         error_rules = [r for r in rules if r.error_marker]
         assert len(error_rules) > 0
@@ -53,10 +52,9 @@ class TestKSemanticsExtractor:
         assert "CEMX1" in error_codes  # Division by 0
         assert "CEMX2" in error_codes  # Modulus by 0
 
-    def test_extractor_extracts_error_marker_details(self, multiplicative_k: Path) -> None:
+    def test_extractor_extracts_error_marker_details(self, multiplicative_rules: list[ParsedRule]) -> None:
         """Extractor should extract error type, code, and message."""
-        extractor = KSemanticsExtractor(multiplicative_k.parent.parent.parent.parent)
-        rules = extractor.parse_file(multiplicative_k)
+        rules = multiplicative_rules
 
         error_rules = [r for r in rules if r.error_marker]
         cemx1_rule = next((r for r in error_rules if r.error_marker and r.error_marker.code == "CEMX1"), None)
@@ -66,10 +64,9 @@ class TestKSemanticsExtractor:
         assert cemx1_rule.error_marker.code == "CEMX1"
         assert "division" in cemx1_rule.error_marker.message.lower() or "0" in cemx1_rule.error_marker.message
 
-    def test_extractor_distinguishes_axiom_vs_error_rules(self, multiplicative_k: Path) -> None:
+    def test_extractor_distinguishes_axiom_vs_error_rules(self, multiplicative_rules: list[ParsedRule]) -> None:
         """Extractor should distinguish positive rules (axioms) from error rules."""
-        extractor = KSemanticsExtractor(multiplicative_k.parent.parent.parent.parent)
-        rules = extractor.parse_file(multiplicative_k)
+        rules = multiplicative_rules
 
         axiom_rules = [r for r in rules if r.requires and not r.error_marker]
         error_rules = [r for r in rules if r.error_marker]
@@ -112,10 +109,9 @@ class TestKSemanticsExtractor:
 class TestFromStandardExtraction:
     """Tests for extracting axioms from \\fromStandard comments."""
 
-    def test_extractor_finds_standard_ref_in_comment(self, stdlib_k: Path) -> None:
+    def test_extractor_finds_standard_ref_in_comment(self, stdlib_rules: list[ParsedRule]) -> None:
         """Extractor should find \\fromStandard comments and extract standard refs."""
-        extractor = KSemanticsExtractor(stdlib_k.parent)
-        rules = extractor.parse_file(stdlib_k)
+        rules = stdlib_rules
 
         # Find rules with standard_ref
         rules_with_std = [r for r in rules if r.standard_ref]
@@ -201,3 +197,146 @@ class TestParsedRule:
         assert rule.source_file
         assert rule.error_marker is None
         assert "structural" in rule.attributes
+
+    def test_parsed_rule_has_no_instance_dict(self) -> None:
+        """ParsedRule is slotted, so instances carry no per-object __dict__."""
+        rule = ParsedRule(
+            lhs="x",
+            rhs="y",
+            requires=None,
+            module="M",
+            source_file="m.k",
+            error_marker=None,
+            attributes=[],
+        )
+
+        assert not hasattr(rule, "__dict__")
+
+
+MULTIPLICATIVE_SOURCE = """\
+module C-COMMON-EXPR-MULTIPLICATIVE
+    rule tv(I1:Int, T::UType) / tv(I2:Int, T'::UType)
+        => intArithInterpret(T, I1 /Int I2)
+        requires isPromoted(T) andBool notBool isZero(I2)
+        [structural]
+endmodule
+"""
+
+
+class TestParseCache:
+    """Tests for the per-extractor parse cache."""
+
+    def test_repeated_parse_reads_file_once(self, tmp_path: Path, monkeypatch) -> None:
+        """Parsing the same unchanged file twice reuses the first result."""
+        k_file = tmp_path / "multiplicative.k"
+        k_file.write_text(MULTIPLICATIVE_SOURCE)
+        extractor = KSemanticsExtractor(tmp_path)
+
+        first = extractor.parse_file(k_file)
+        monkeypatch.setattr(Path, "read_text", lambda *args, **kwargs: "")
+        second = extractor.parse_file(k_file)
+
+        assert len(first) == 1
+        assert second == first
+        assert second is not first
+
+    def test_modified_file_is_reparsed(self, tmp_path: Path) -> None:
+        """Changing a file's mtime invalidates its cached rules."""
+        import os
+
+        k_file = tmp_path / "multiplicative.k"
+        k_file.write_text(MULTIPLICATIVE_SOURCE)
+        extractor = KSemanticsExtractor(tmp_path)
+        assert len(extractor.parse_file(k_file)) == 1
+
+        k_file.write_text("module EMPTY\nendmodule\n")
+        stat = k_file.stat()
+        os.utime(k_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert extractor.parse_file(k_file) == []
+
+    def test_disk_cache_reused_across_extractors(self, tmp_path: Path, monkeypatch) -> None:
+        """A fresh extractor loads rules from the on-disk cache without re-parsing."""
+        k_file = tmp_path / "multiplicative.k"
+        k_file.write_text(MULTIPLICATIVE_SOURCE)
+        cache_dir = tmp_path / "cache"
+
+        first = KSemanticsExtractor(tmp_path, cache_dir=cache_dir).parse_file(k_file)
+        monkeypatch.setattr(KSemanticsExtractor, "_parse_content", None)
+        second = KSemanticsExtractor(tmp_path, cache_dir=cache_dir).parse_file(k_file)
+
+        assert len(first) == 1
+        assert second == first
+        assert len(list(cache_dir.rglob("*"))) == 2  # one shard directory, one entry
+
+    def test_disk_cache_keyed_by_content(self, tmp_path: Path) -> None:
+        """Changing a file's contents misses the on-disk cache."""
+        k_file = tmp_path / "multiplicative.k"
+        k_file.write_text(MULTIPLICATIVE_SOURCE)
+        cache_dir = tmp_path / "cache"
+        assert len(KSemanticsExtractor(tmp_path, cache_dir=cache_dir).parse_file(k_file)) == 1
+
+        k_file.write_text("module EMPTY\nendmodule\n")
+
+        assert KSemanticsExtractor(tmp_path, cache_dir=cache_dir).parse_file(k_file) == []
+
+    def test_disk_cache_miss_reads_file_once(self, tmp_path: Path, monkeypatch) -> None:
+        """A miss hashes and parses one read of the file."""
+        k_file = tmp_path / "multiplicative.k"
+        k_file.write_text(MULTIPLICATIVE_SOURCE)
+        monkeypatch.setattr(Path, "read_text", None)
+
+        rules = KSemanticsExtractor(tmp_path, cache_dir=tmp_path / "cache").parse_file(k_file)
+
+        assert len(rules) == 1
+
+    @pytest.mark.parametrize(
+        "entry",
+        [
+            b"",  # truncated
+            b"not a pickle",
+            b"cno_such_module\nX\n.",  # module gone
+            b"caxiom.extractors.k_semantics\nNoSuchRule\n.",  # class renamed
+        ],
+    )
+    def test_bad_disk_entry_is_reparsed(self, tmp_path: Path, entry: bytes) -> None:
+        """An entry that fails to unpickle is treated as a miss and rewritten."""
+        k_file = tmp_path / "multiplicative.k"
+        k_file.write_text(MULTIPLICATIVE_SOURCE)
+        cache_dir = tmp_path / "cache"
+        expected = KSemanticsExtractor(tmp_path, cache_dir=cache_dir).parse_file(k_file)
+        (entry_path,) = (path for path in cache_dir.rglob("*") if path.is_file())
+        entry_path.write_bytes(entry)
+
+        rules = KSemanticsExtractor(tmp_path, cache_dir=cache_dir).parse_file(k_file)
+
+        assert rules == expected
+        assert entry_path.read_bytes() != entry
+
+
+class TestExtractAllWorkers:
+    """Tests for extract_all worker sizing."""
+
+    def test_single_file_parsed_in_process(self, tmp_path: Path, monkeypatch) -> None:
+        """One file is never sent to a process pool, whatever max_workers is."""
+        import concurrent.futures
+
+        (tmp_path / "multiplicative.k").write_text(MULTIPLICATIVE_SOURCE)
+        monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", None)
+
+        axioms = KSemanticsExtractor(tmp_path).extract_all(max_workers=None)
+
+        assert len(axioms) == 1
+
+    def test_cpu_sized_pool_matches_sequential(self, tmp_path: Path) -> None:
+        """max_workers=None parses across CPUs with the same results in walk order."""
+        for name in ("a", "b", "c"):
+            (tmp_path / f"{name}.k").write_text(
+                MULTIPLICATIVE_SOURCE.replace("MULTIPLICATIVE", name.upper())
+            )
+
+        sequential = KSemanticsExtractor(tmp_path).extract_all()
+        parallel = KSemanticsExtractor(tmp_path).extract_all(max_workers=None)
+
+        assert len(sequential) == 3
+        assert parallel == sequential
@@ -163,6 +163,57 @@ class TestAxiomLinker:
         # Should not link - only 1 common term (need >= 2)
         assert len(result.axioms[0].violated_by) == 0
 
+    def test_pattern_links_follow_error_code_order(self):
+        """Strong matches are linked in error-code order, weak ones skipped."""
+        linker = AxiomLinker()
+
+        axiom = create_test_axiom(
+            id="div_int",
+            formal_spec="someCheck(x)",
+            tags=["zero", "division", "integer"],
+        )
+        errors = [
+            create_test_error_code(
+                internal_code="SE-INT1", description="Integer division overflow"
+            ),
+            create_test_error_code(internal_code="SE-PTR1", description="Pointer to integer"),
+            create_test_error_code(internal_code="SE-DIV1", description="Division by zero"),
+        ]
+
+        result = linker.link([axiom], errors)
+
+        codes = [v.code for v in result.axioms[0].violated_by]
+        assert codes == ["SE-INT1", "SE-DIV1"]
+        assert codes == [
+            ec.internal_code for ec in errors if linker._is_strong_match(axiom, ec)
+        ]
+
+    def test_pattern_links_agree_with_strong_match(self):
+        """Vectorized pattern linking links exactly the strong matches, per axiom."""
+        from axiom.extractors.linker import ERROR_TERM_PATTERNS
+
+        linker = AxiomLinker()
+        terms = list(ERROR_TERM_PATTERNS)
+        axioms = [
+            create_test_axiom(id=f"ax_{i}", formal_spec="check(x)", tags=terms[i : i + 3])
+            for i in range(len(terms))
+        ]
+        errors = [
+            create_test_error_code(
+                internal_code=f"SE-{i}", description=f"{terms[i]} and {terms[i - 1]}"
+            )
+            for i in range(len(terms))
+        ]
+        expected = {
+            axiom.id: [ec.internal_code for ec in errors if linker._is_strong_match(axiom, ec)]
+            for axiom in axioms
+        }
+
+        result = linker.link(axioms, errors)
+
+        assert {a.id: [v.code for v in a.violated_by] for a in result.axioms} == expected
+        assert any(expected.values())
+
 
 class TestExtractPredicates:
     """Tests for _extract_predicates method."""
@@ -244,6 +295,16 @@ class TestExtractErrorTerms:
         assert "overflow" in terms
         assert "integer" in terms
 
+    def test_repeated_description_reuses_terms(self):
+        """Identical descriptions share one immutable cached result."""
+        linker = AxiomLinker()
+
+        first = linker._extract_error_terms("Division by zero is undefined")
+        second = AxiomLinker()._extract_error_terms("Division by zero is undefined")
+
+        assert first is second
+        assert isinstance(first, frozenset)
+
 
 class TestExtractAxiomTerms:
     """Tests for _extract_axiom_terms method."""
@@ -278,6 +339,16 @@ class TestExtractAxiomTerms:
 
         assert "zero" in terms
 
+    def test_tags_are_part_of_cache_key(self):
+        """Axioms with the same spec but different tags get different terms."""
+        linker = AxiomLinker()
+
+        tagged = create_test_axiom(formal_spec="check(x)", tags=["division"])
+        untagged = create_test_axiom(formal_spec="check(x)")
+
+        assert "division" in linker._extract_axiom_terms(tagged)
+        assert "division" not in linker._extract_axiom_terms(untagged)
+
 
 class TestIsStrongMatch:
     """Tests for _is_strong_match method."""
@@ -310,6 +381,26 @@ class TestIsStrongMatch:
 
         assert linker._is_strong_match(axiom, error) is False
 
+    def test_matches_common_term_count(self):
+        """Strong match agrees with counting the common term sets."""
+        linker = AxiomLinker()
+
+        axiom = create_test_axiom(
+            formal_spec="isPointer(p)",
+            tags=["division", "custom_tag"],
+        )
+        for description in [
+            "Division of custom_tag values",
+            "Pointer division",
+            "Pointer to integer conversion",
+        ]:
+            error = create_test_error_code(description=description)
+            common = linker._extract_axiom_terms(axiom) & linker._extract_error_terms(
+                description
+            )
+
+            assert linker._is_strong_match(axiom, error) is (len(common) >= 2)
+
 
 class TestRulesAreRelated:
     """Tests for _rules_are_related method."""
@@ -343,6 +434,18 @@ class TestRulesAreRelated:
 
         assert linker._rules_are_related(axiom, error_rule) is True
 
+    def test_predicates_related_when_sharing_any(self):
+        """Precomputed predicate sets are related exactly when they intersect."""
+        linker = AxiomLinker()
+
+        assert linker._predicates_are_related(
+            frozenset({"isZero"}), frozenset({"isZero", "isPromoted"})
+        )
+        assert not linker._predicates_are_related(
+            frozenset({"isPointer"}), frozenset({"isZero"})
+        )
+        assert not linker._predicates_are_related(frozenset(), frozenset({"isZero"}))
+
     def test_not_related_without_requires(self):
         """Test that rules without requires are not related."""
         linker = AxiomLinker()
@@ -441,6 +544,38 @@ class TestLinkViaErrorRules:
 
         assert len(axiom.violated_by) == 0
 
+    def test_rules_interleaved_across_modules_keep_order(self):
+        """Each axiom gets violations in rule order, even with modules interleaved."""
+        from axiom.extractors.k_semantics import ErrorMarker, ParsedRule
+
+        linker = AxiomLinker()
+        div_axiom = create_test_axiom(id="div", formal_spec="isZero(V)", module="expr-div")
+        ptr_axiom = create_test_axiom(id="ptr", formal_spec="isPointer(P)", module="expr-ptr")
+
+        def rule(module: str, code: str, requires: str) -> ParsedRule:
+            return ParsedRule(
+                lhs="",
+                rhs="",
+                requires=requires,
+                module=module,
+                source_file="test.k",
+                error_marker=ErrorMarker(error_type="UNDEF", code=code, message=code),
+                attributes=[],
+            )
+
+        linker._link_via_error_rules(
+            [div_axiom, ptr_axiom],
+            [
+                rule("expr-div", "CEMX2", "isZero(V)"),
+                rule("expr-ptr", "CEA1", "isPointer(P)"),
+                rule("expr-div", "CEMX1", "notBool isZero(V)"),
+                rule("expr-other", "CEO1", "isZero(V)"),
+            ],
+        )
+
+        assert [v.code for v in div_axiom.violated_by] == ["CEMX2", "CEMX1"]
+        assert [v.code for v in ptr_axiom.violated_by] == ["CEA1"]
+
     def test_no_duplicate_violations_from_rules(self):
         """Test that the same violation is not added twice from rules."""
         linker = AxiomLinker()
@@ -470,3 +605,26 @@ class TestLinkViaErrorRules:
 
         # Should still only have one violation
         assert len(axiom.violated_by) == 1
+
+    def test_repeated_rule_code_linked_once(self):
+        """Several rules with the same error code link an axiom only once."""
+        linker = AxiomLinker()
+
+        axiom = create_test_axiom(
+            formal_spec="isPromoted(T) andBool isZero(V) andBool hasIntegerType(T)",
+            module="expr-div",
+        )
+
+        class MockErrorMarker:
+            code = "SE-DIV1"
+            error_type = "UB"
+            message = "Division by zero"
+
+        class MockErrorRule:
+            module = "expr-div"
+            error_marker = MockErrorMarker()
+            requires = "isPromoted(T) andBool isZero(V) andBool hasIntegerType(T)"
+
+        linker._link_via_error_rules([axiom], [MockErrorRule(), MockErrorRule()])
+
+        assert [v.code for v in axiom.violated_by] == ["SE-DIV1"]
@@ -94,6 +94,97 @@ class TestGroupByFunction:
         assert groups == {}
 
 
+class TestBuildConceptQueries:
+    """Tests for keyword-driven foundation concept queries."""
+
+    def test_detects_lambda_keywords(self) -> None:
+        """Lambda mentions produce the lambda concept query."""
+        from axiom.extractors.semantic_linker import build_concept_queries
+
+        queries = build_concept_queries("The Lambda is invoked once per element")
+
+        assert queries == ["lambda expression capture closure"]
+
+    def test_one_query_per_concept(self) -> None:
+        """Several keywords for one concept yield a single query."""
+        from axiom.extractors.semantic_linker import build_concept_queries
+
+        queries = build_concept_queries("iterator loop over the range")
+
+        assert queries == ["range-based for loop iterator"]
+
+    def test_preserves_concept_order(self) -> None:
+        """Queries follow CONCEPT_QUERIES order, not match order."""
+        from axiom.extractors.semantic_linker import (
+            CONCEPT_QUERIES,
+            build_concept_queries,
+        )
+
+        queries = build_concept_queries("loop body captures by reference inside a lambda")
+
+        assert queries == [q for q in CONCEPT_QUERIES if q in queries]
+        assert len(queries) == 3
+
+    def test_no_keywords(self) -> None:
+        """Content without concept keywords yields no queries."""
+        from axiom.extractors.semantic_linker import build_concept_queries
+
+        assert build_concept_queries("Divisor must not be zero") == []
+
+
+class TestHasFoundationDependency:
+    """Tests for detecting existing foundation links."""
+
+    def test_detects_foundation_dependency(self) -> None:
+        """Axioms depending on a foundation layer axiom are detected."""
+        from axiom.extractors.semantic_linker import has_foundation_dependency
+
+        axiom = create_test_axiom(depends_on=["lib_other", "cpp20_lambda_capture"])
+
+        assert has_foundation_dependency(axiom) is True
+
+    def test_ignores_library_only_dependencies(self) -> None:
+        """Library-only and empty depends_on are not foundation links."""
+        from axiom.extractors.semantic_linker import has_foundation_dependency
+
+        assert has_foundation_dependency(create_test_axiom(depends_on=["lib_other"])) is False
+        assert has_foundation_dependency(create_test_axiom()) is False
+
+
+class TestPartitionForLinking:
+    """Tests for single-pass grouping of axioms that still need links."""
+
+    def test_skips_linked_axioms_and_counts_them(self) -> None:
+        """Already-linked axioms are counted but not grouped."""
+        from axiom.extractors.semantic_linker import partition_for_linking
+
+        axioms = [
+            create_test_axiom(id="a1", function="foo", depends_on=["cpp_core_1"]),
+            create_test_axiom(id="a2", function="foo"),
+            create_test_axiom(id="a3", function=None),
+        ]
+
+        groups, linked = partition_for_linking(axioms)
+
+        assert linked == 1
+        assert [a.id for a in groups["foo"]] == ["a2"]
+        assert [a.id for a in groups["ungrouped"]] == ["a3"]
+
+    def test_include_linked_matches_group_by_function(self) -> None:
+        """With include_linked, groups match group_by_function."""
+        from axiom.extractors.semantic_linker import group_by_function, partition_for_linking
+
+        axioms = [
+            create_test_axiom(id="a1", function="foo", depends_on=["cpp_core_1"]),
+            create_test_axiom(id="a2", function="bar"),
+        ]
+
+        groups, linked = partition_for_linking(axioms, include_linked=True)
+
+        assert linked == 1
+        assert groups == group_by_function(axioms)
+
+
 class TestFilterFoundationLayers:
     """Tests for filtering search results to foundation layers only."""
 
@@ -137,6 +228,43 @@ class TestFilterFoundationLayers:
         assert filtered == []
 
 
+class TestSearchFoundations:
+    """Tests for foundation search with result caching."""
+
+    def test_filters_and_limits_results(self) -> None:
+        """Library results are dropped and the limit applied."""
+        from unittest.mock import MagicMock
+
+        from axiom.extractors.semantic_linker import search_foundations
+
+        lance = MagicMock()
+        lance.search.return_value = [
+            {"id": "lib_1", "layer": "library"},
+            {"id": "cpp_1", "layer": "cpp_core"},
+            {"id": "cpp_2", "layer": "cpp_core"},
+        ]
+
+        results = search_foundations("lambda", lance, limit=1)
+
+        assert [r["id"] for r in results] == ["cpp_1"]
+        lance.search.assert_called_once_with("lambda", limit=10)
+
+    def test_cache_skips_repeat_empty_queries(self) -> None:
+        """A query with no foundation hits is only searched once."""
+        from unittest.mock import MagicMock
+
+        from axiom.extractors.semantic_linker import search_foundations
+
+        lance = MagicMock()
+        lance.search.return_value = [{"id": "lib_1", "layer": "library"}]
+        cache: dict = {}
+
+        assert search_foundations("nothing", lance, cache=cache) == []
+        assert search_foundations("nothing", lance, cache=cache) == []
+
+        assert lance.search.call_count == 1
+
+
 class TestMergeDependsOn:
     """Tests for merging new links with existing depends_on."""
 
@@ -184,6 +312,14 @@ class TestMergeDependsOn:
 
         assert merged == ["axiom_1"]
 
+    def test_preserves_order(self) -> None:
+        """Existing links keep their order and new links follow."""
+        from axiom.extractors.semantic_linker import merge_depends_on
+
+        merged = merge_depends_on(["b", "a"], ["c", "a", "d"])
+
+        assert merged == ["b", "a", "c", "d"]
+
 
 class TestParseLLMResponse:
     """Tests for parsing LLM JSON output."""
@@ -184,6 +184,25 @@ content = "Some axiom content"
 
         assert axioms == []
 
+    def test_reparsed_response_returns_independent_axioms(self):
+        """Test that memoized parsing does not share state between results."""
+        extractor = AxiomExtractor()
+
+        response = '''```toml
+[[axioms]]
+id = "memo_axiom"
+function = "memo"
+content = "Memoized axiom"
+depends_on = ["c11_base"]
+```'''
+
+        first = extractor._parse_llm_response(response, "memo", "", "test.cpp")
+        first[0].depends_on.append("c11_extra")
+        second = extractor._parse_llm_response(response, "memo", "", "test.cpp")
+
+        assert second[0].depends_on == ["c11_base"]
+        assert second[0] is not first[0]
+
 
 class TestPromptBuilding:
     """Tests for prompt building functions."""
@@ -459,6 +478,127 @@ class TestHazardousOperationDetection:
         assert extractor._has_hazardous_ops(subgraph_no_calls) is False
 
 
+class RecordingVectorDB:
+    """Vector DB stub that records batched searches."""
+
+    def __init__(self, results: dict[str, list[dict]] | None = None):
+        self.results = results or {}
+        self.batches: list[list[str]] = []
+
+    def search_batch(self, queries, limit=10):
+        self.batches.append(list(queries))
+        return [self.results.get(q, []) for q in queries]
+
+
+class TestRAGQueryCache:
+    """Tests for RAG query batching and caching."""
+
+    def test_batches_and_dedupes_queries(self):
+        """Test that duplicate queries are searched once, in one batch."""
+        db = RecordingVectorDB({
+            "null pointer dereference": [{"id": "c11_null"}],
+            "division by zero": [{"id": "c11_div"}, {"id": "c11_null"}],
+        })
+        extractor = AxiomExtractor(vector_db=db)
+
+        results = extractor._search_queries([
+            "null pointer dereference",
+            "division by zero",
+            "  Null Pointer Dereference ",
+        ])
+
+        assert db.batches == [["null pointer dereference", "division by zero"]]
+        assert [r["id"] for r in results] == ["c11_null", "c11_div"]
+
+    def test_reuses_cached_results_across_functions(self):
+        """Test that queries repeated across functions hit the cache."""
+        code = """
+        int f(int x, int y) { return x / y; }
+        int g(int a, int b) { return a % b; }
+        """
+        db = RecordingVectorDB()
+        extractor = AxiomExtractor(vector_db=db)
+
+        extractor.extract_from_source(code, "f")
+        extractor.extract_from_source(code, "g")
+
+        assert len(db.batches) == 1
+
+
+class RecordingAnthropicClient:
+    """Anthropic client stub that records messages.create kwargs."""
+
+    def __init__(self):
+        self.calls: list[dict] = []
+        self.messages = self
+
+    def create(self, **kwargs):
+        from types import SimpleNamespace
+
+        self.calls.append(kwargs)
+        return SimpleNamespace(content=[SimpleNamespace(text="ok")])
+
+
+class TestPromptCaching:
+    """Tests for Anthropic prompt caching of system prompts."""
+
+    def test_function_prompt_caches_system_prompt(self):
+        """Test that function extraction marks the system prompt cacheable."""
+        from axiom.ingestion.prompts import SYSTEM_PROMPT
+
+        client = RecordingAnthropicClient()
+        extractor = AxiomExtractor(llm_client=client)
+
+        assert extractor._call_llm("prompt") == "ok"
+
+        system = client.calls[0]["system"]
+        assert system[0]["text"] == SYSTEM_PROMPT
+        assert system[0]["cache_control"] == {"type": "ephemeral"}
+
+    def test_macro_prompt_caches_system_prompt(self):
+        """Test that macro extraction marks its system prompt cacheable."""
+        from axiom.ingestion.prompts import MACRO_SYSTEM_PROMPT
+
+        client = RecordingAnthropicClient()
+        extractor = AxiomExtractor(llm_client=client)
+
+        assert extractor._call_macro_llm("prompt") == "ok"
+
+        system = client.calls[0]["system"]
+        assert system[0]["text"] == MACRO_SYSTEM_PROMPT
+        assert system[0]["cache_control"] == {"type": "ephemeral"}
+
+
+class TestResponseCache:
+    """Tests for reusing LLM responses for identical prompts."""
+
+    def test_identical_prompt_calls_llm_once(self):
+        """Test that re-extracting the same function reuses the response."""
+        code = "int f(int x, int y) { return x / y; }"
+        client = RecordingAnthropicClient()
+        extractor = AxiomExtractor(llm_client=client)
+
+        first = extractor.extract_from_source(code, "f")
+        second = extractor.extract_from_source(code, "f")
+
+        assert len(client.calls) == 1
+        assert second.raw_response == first.raw_response
+
+    def test_different_prompts_are_not_shared(self):
+        """Test that different functions get their own LLM calls."""
+        code = """
+        int f(int x, int y) { return x / y; }
+        int g(int a, int b) { return a % b; }
+        """
+        client = RecordingAnthropicClient()
+        extractor = AxiomExtractor(llm_client=client)
+
+        extractor.extract_from_source(code, "f")
+        extractor.extract_from_source(code, "g")
+
+        assert len(client.calls) == 2
+
+
 class TestMacroExtraction:
     """Tests for macro extraction functionality in AxiomExtractor."""
 
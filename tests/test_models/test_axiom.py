@@ -2,7 +2,7 @@
 
 import pytest
 
-from axiom.models import Axiom, AxiomType, SourceLocation
+from axiom.models import Axiom, AxiomCollection, AxiomType, SourceLocation
 
 
 class TestAxiomType:
@@ -124,6 +124,57 @@ class TestAxiomDependsOn:
         assert loaded.axioms[0].depends_on == ["foundation_1", "foundation_2"]
 
 
+class TestAxiomHash:
+    """Tests for hashing and equality of Axiom."""
+
+    def _make(self, axiom_id: str, content: str = "Pointer must be valid") -> Axiom:
+        return Axiom(
+            id=axiom_id,
+            content=content,
+            formal_spec="p != nullptr",
+            source=SourceLocation(file="test.h", module="test"),
+        )
+
+    def test_equal_axioms_hash_equal(self):
+        """Field-equal axioms have equal hashes and dedupe in a set."""
+        first = self._make("axiom_a")
+        second = self._make("axiom_a")
+
+        assert first == second
+        assert hash(first) == hash(second)
+        assert len({first, second}) == 1
+
+    def test_same_id_different_content_not_equal(self):
+        """Equality still compares every field, not just the ID."""
+        first = self._make("axiom_a")
+        second = self._make("axiom_a", content="Pointer may be null")
+
+        assert first != second
+        assert len({first, second}) == 2
+
+
+class TestValueModels:
+    """Tests for the immutable SourceLocation and ViolationRef models."""
+
+    def test_source_location_is_frozen(self):
+        """SourceLocation fields can't be reassigned."""
+        from pydantic import ValidationError
+
+        location = SourceLocation(file="test.k", module="test")
+
+        with pytest.raises(ValidationError):
+            location.module = "other"
+
+    def test_violation_refs_dedupe_in_set(self):
+        """Equal ViolationRefs hash equal, so they can be deduplicated."""
+        from axiom.models import ViolationRef
+
+        first = ViolationRef(code="CEMX1", error_type="UNDEF", message="Division by 0")
+        second = ViolationRef(code="CEMX1", error_type="UNDEF", message="Division by 0")
+
+        assert len({first, second}) == 1
+
+
 class TestEffectiveConfidence:
     """Tests for effective_confidence property."""
 
@@ -284,6 +335,42 @@ class TestEffectiveConfidence:
         assert axiom.effective_confidence == 0.7
 
 
+class TestAxiomCollectionGroupByType:
+    """Tests for AxiomCollection.group_by_type."""
+
+    def _make(self, axiom_id: str, axiom_type: AxiomType | None) -> Axiom:
+        return Axiom(
+            id=axiom_id,
+            content="content",
+            formal_spec="",
+            source=SourceLocation(file="test.h", module="test"),
+            axiom_type=axiom_type,
+        )
+
+    def test_groups_in_collection_order(self):
+        """Axioms are bucketed by type, keeping their original order."""
+        pre_a = self._make("pre_a", AxiomType.PRECONDITION)
+        effect = self._make("effect", AxiomType.EFFECT)
+        untyped = self._make("untyped", None)
+        pre_b = self._make("pre_b", AxiomType.PRECONDITION)
+        collection = AxiomCollection(axioms=[pre_a, effect, untyped, pre_b])
+
+        groups = collection.group_by_type()
+
+        assert groups == {
+            AxiomType.PRECONDITION: [pre_a, pre_b],
+            AxiomType.EFFECT: [effect],
+            None: [untyped],
+        }
+
+    def test_reflects_axioms_added_later(self):
+        """Grouping is computed on demand, so later additions are included."""
+        collection = AxiomCollection()
+        collection.axioms.append(self._make("effect", AxiomType.EFFECT))
+
+        assert [a.id for a in collection.group_by_type()[AxiomType.EFFECT]] == ["effect"]
+
+
 class TestAxiomCollectionToml:
     """Tests for AxiomCollection TOML serialization."""
 
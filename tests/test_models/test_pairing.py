@@ -83,6 +83,18 @@ class TestIdiom:
         assert "${body}" in idiom.template
         assert idiom.source == "comment_annotation"
 
+    def test_pairing_and_idiom_use_slots(self) -> None:
+        """Pairing and Idiom instances have no per-instance __dict__."""
+        from axiom.models.pairing import Idiom, Pairing
+
+        pairing = Pairing(
+            opener_id="a", closer_id="b", required=True, source="spec", confidence=1.0
+        )
+        idiom = Idiom(id="idiom_x", name="x")
+
+        assert not hasattr(pairing, "__dict__")
+        assert not hasattr(idiom, "__dict__")
+
 
 class TestPairingSource:
     """Tests for different pairing sources."""
@@ -0,0 +1,71 @@
+# Axiom - Grounded truth validation for LLMs
+# Copyright (c) 2025 Matt Varendorff
+# https://github.com/mattyv/axiom
+# SPDX-License-Identifier: BSL-1.0
+
+"""Tests for LanceDBLoader.search_batch.
+
+These tests require lancedb to be installed.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+# Skip all tests in this module if lancedb is not installed
+lancedb = pytest.importorskip("lancedb")
+
+
+class FakeModel:
+    """Embeds each query as (length, first character code)."""
+
+    def encode(self, queries: str | list[str]) -> np.ndarray:
+        if isinstance(queries, str):
+            return np.array([len(queries), ord(queries[0])], dtype=float)
+        return np.array([[len(q), ord(q[0])] for q in queries], dtype=float)
+
+
+class FakeTable:
+    """Returns records derived from the query vector, honouring limit."""
+
+    def search(self, vector: list[float]) -> MagicMock:
+        records = [{"id": f"hit_{vector[0]:g}_{vector[1]:g}_{i}"} for i in range(3)]
+        query = MagicMock()
+        query.limit.side_effect = lambda n: MagicMock(to_list=lambda: records[:n])
+        return query
+
+
+@pytest.fixture
+def loader():
+    """LanceDBLoader backed by the fake table and embedding model."""
+    from axiom.vectors.loader import LanceDBLoader
+
+    with patch.object(LanceDBLoader, "__init__", lambda self, **kwargs: None):
+        loader = LanceDBLoader()
+    loader.db = MagicMock()
+    loader.db.table_names.return_value = ["axioms"]
+    loader.db.open_table.return_value = FakeTable()
+    loader._model = FakeModel()
+    return loader
+
+
+class TestSearchBatch:
+    """Tests for search_batch method."""
+
+    def test_matches_per_query_search_in_order(self, loader) -> None:
+        """Each batched result list equals search() for the same query."""
+        queries = ["division by zero", "null pointer", "overflow"]
+
+        batched = loader.search_batch(queries, limit=2)
+
+        assert batched == [loader.search(query, limit=2) for query in queries]
+
+    def test_empty_query_list(self, loader) -> None:
+        """No queries returns no result lists without opening the table."""
+        assert loader.search_batch([]) == []
+        loader.db.open_table.assert_not_called()
+
+    def test_missing_table_returns_empty_lists(self, loader) -> None:
+        """A missing table yields one empty result list per query."""
+        assert loader.search_batch(["a", "b"], table_name="missing") == [[], []]